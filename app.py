@@ -1,11 +1,18 @@
 import os
 import math
+import time
+import bisect
 import asyncio
 import signal
 import atexit
-from datetime import datetime, timedelta
+import contextvars
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
-from nicegui import ui, run, app
+from nicegui import ui, run, app, binding, Client
 from event_manager import EventManager, Event
 from timer_manager import TimerManager
 from time_service import time_service
@@ -15,6 +22,194 @@ from audio_service import audio_service
 # Load environment variables
 load_dotenv()
 
+# Lifetime stats before anything has been recorded
+_DEFAULT_LIFETIME_STATS = {
+    "total_sessions": 0,
+    "total_ml_consumed": 0.0,
+    "total_drink_events": 0,
+    "days_tracked": 0
+}
+
+# Lifetime stats panel text; avg_per_day is filled in when rendering
+_LIFETIME_STATS_TEMPLATE = (
+    "Sessions: {total_sessions}\n"
+    "Total Consumed: {total_ml_consumed:.0f}ml\n"
+    "Drink Events: {total_drink_events}\n"
+    "Days Tracked: {days_tracked}\n"
+    "Avg per Day: {avg_per_day:.0f}ml"
+)
+
+# Set while running code with no UI slot (timer callbacks), so toasts go straight to the console
+_IN_BACKGROUND_TASK = contextvars.ContextVar('in_background_task', default=False)
+
+# Last time each throttled console message was printed (see _print_throttled)
+_LAST_PRINTED = {}
+
+def _print_throttled(key: str, message: str, interval: float = 1.0):
+    """Print a message at most once per interval seconds for its key - for errors on 1 Hz refresh paths"""
+    now = time.monotonic()
+    if now - _LAST_PRINTED.get(key, -interval) >= interval:
+        _LAST_PRINTED[key] = now
+        print(message)
+
+# Minimum seconds between display refreshes; requests in between are coalesced
+_UI_REFRESH_MIN_INTERVAL = 0.15
+
+# Seconds to wait for an answer to the recalibration dialog before treating it as dismissed
+_RECALIBRATE_DIALOG_TIMEOUT = 120.0
+
+# Ids of clients whose browser tab is currently hidden (see _on_page_visibility)
+_HIDDEN_CLIENT_IDS = set()
+
+_VISIBILITY_SCRIPT = '''<script>
+document.addEventListener('visibilitychange', () => emitEvent('page_visibility', document.visibilityState === 'visible'));
+</script>'''
+
+def _has_visible_client() -> bool:
+    """Check whether any connected browser tab is visible and can show UI updates"""
+    return any(
+        client.has_socket_connection and client.id not in _HIDDEN_CLIENT_IDS
+        for client in Client.instances.values()
+    )
+
+class DrinkRecord(NamedTuple):
+    """A drink in the praise or reminder window"""
+    amount_ml: float
+    timestamp: datetime
+
+class TimerRow(NamedTuple):
+    """Display text for one timer panel row"""
+    name: str
+    status: str
+    interval: str
+    countdown: str
+    severity: str
+    next_trigger: str
+
+# Dehydration level display table, indexed by bisect_left on the upper bounds:
+# (status, status when urgent, short emoji, short text)
+_DEHYDRATION_BOUNDS = (0.5, 1.2, 2.0)
+_DEHYDRATION_TABLE = (
+    ("💧 Well Hydrated", "💧 Well Hydrated but URGENT timing!", "💧✨", "Well Hydrated"),
+    ("💧 Mild Dehydration", "💧 Mild Dehydration + URGENT!", "💧", "Mild Dehydration"),
+    ("⚠️ Moderate Dehydration", "⚠️ Moderate Dehydration + URGENT!", "⚠️", "Moderate Dehydration"),
+    ("🚨 Severe Dehydration", "🚨 Severe Dehydration + URGENT!", "🚨", "Severe Dehydration"),
+)
+
+# Urgency suffixes indexed by bisect_left on the urgency factor bounds: none / high / urgent
+_URGENCY_BOUNDS = (1.0, 2.0)
+_URGENCY_INDICATORS = ("", " ⏰ High Priority", " ⚠️ URGENT")
+_URGENCY_SUFFIXES = ("", " (High Priority)", " (URGENT!)")
+
+def _dehydration_labels(level, urgency_index):
+    """Look up (long status, short emoji, short text, urgency suffix) for a dehydration level in one pass"""
+    status, urgent_status, short_emoji, short_text = _DEHYDRATION_TABLE[bisect.bisect_left(_DEHYDRATION_BOUNDS, level)]
+    return (urgent_status if urgency_index == 2 else status), short_emoji, short_text, _URGENCY_SUFFIXES[urgency_index]
+
+# Drink reminder severity by dehydration level, indexed by bisect_right on the lower bounds:
+# (description, emoji, base severity, cap on the level-derived part)
+_SEVERITY_BOUNDS = (0.8, 1.5, 2.5)
+_SEVERITY_TABLE = (
+    ("MINIMAL", "💧", 0, 5),    # 1-5 range
+    ("MILD", "💧", 5, 5),       # 5-10 range
+    ("MODERATE", "⚠️", 10, 10),  # 10-20 range
+    ("SEVERE", "🚨", 20, 10),    # 20-30 range
+)
+
+def _reminder_severity(dehydration_level):
+    """Look up (description, emoji, severity level) for a drink reminder at this dehydration level"""
+    severity_desc, urgency_emoji, base, cap = _SEVERITY_TABLE[bisect.bisect_right(_SEVERITY_BOUNDS, dehydration_level)]
+    return severity_desc, urgency_emoji, max(1, base + min(int(dehydration_level * 5), cap))
+
+def _drink_severity_display(dehydration_level):
+    """Timer panel severity text for the drink reminder"""
+    _, urgency_emoji, severity = _reminder_severity(dehydration_level)
+    return f"{urgency_emoji} {severity}"
+
+# Ignored-reminder count severity prefix, indexed by bisect_right on the lower bounds: low / warning / critical
+_COUNT_SEVERITY_BOUNDS = (5, 10)
+_COUNT_SEVERITY_EMOJIS = ("📊", "⚠️", "🚨")
+
+def _count_severity_display(count):
+    """Timer panel severity text for an ignored-reminder count"""
+    if count == 0:
+        return "-"
+    return f"{_COUNT_SEVERITY_EMOJIS[bisect.bisect_right(_COUNT_SEVERITY_BOUNDS, count)]} {count}"
+
+# Countdown text for the last minute before a trigger, indexed by whole seconds
+_SECONDS_TEXT = tuple(f"{i}s" for i in range(60))
+
+def _format_countdown(total_seconds):
+    """Timer panel countdown text, e.g. 3725 -> '1h 2m 5s'"""
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
+    
+    if hours > 0:
+        return f"{hours}h {minutes}m {seconds}s"
+    elif minutes > 0:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+@functools.lru_cache(maxsize=32)
+def _timer_display_name(name):
+    """Timer panel name, e.g. 'drink_reminder' -> 'Drink Reminder'"""
+    return name.replace('_', ' ').title()
+
+@functools.lru_cache(maxsize=32)
+def _interval_display(interval_minutes):
+    """Timer panel interval text; keyed by the interval, so interval updates need no invalidation"""
+    return f"{interval_minutes}m"
+
+# Timers that only exist for the accelerometer/empty-bottle simulation
+_SIMULATOR_ONLY_TIMERS = frozenset(('bad_orientation', 'empty_reminder'))
+
+# Hydration window status indexed by (now >= start) + (now >= end) for a window that doesn't wrap midnight
+_WINDOW_STATUSES = ("before_window", "in_window", "after_window")
+
+# Drink reminder messages by hydration window state; templates take emoji, hours, ml, desc and level
+_REMINDER_MESSAGE_TEMPLATES = {
+    'urgent': "{emoji} URGENT Drink Reminder! Only {hours:.1f}h left! Need {ml:.0f}ml more! Dehydration: {desc} ({level:.1f})",
+    'priority': "{emoji} Priority Drink Reminder! {hours:.1f}h remaining. Need {ml:.0f}ml. Dehydration: {desc} ({level:.1f})",
+    'after_window': "{emoji} Late Drink Reminder (after hydration hours). Dehydration: {desc} ({level:.1f})",
+    'before_window': "{emoji} Early Drink Reminder (before hydration hours). Dehydration: {desc} ({level:.1f})",
+    'default': "{emoji} Drink Reminder! Dehydration: {desc} ({level:.1f})",
+}
+
+# In-window reminder template by urgency, indexed by bisect_left on _URGENCY_BOUNDS (like the urgency suffixes)
+_IN_WINDOW_REMINDER_KINDS = ('default', 'priority', 'urgent')
+
+# Configuration from environment variables, parsed once at import
+_ENV_CONFIG = {
+    'reminder_timer_minutes': int(os.getenv('REMINDER_TIMER_MINUTES', 45)),
+    'drink_reminder_base': int(os.getenv('DRINK_REMINDER_BASE', 45)),
+    'drink_reminder_limit': int(os.getenv('DRINK_REMINDER_LIMIT', 10)),
+    'bad_orientation_base': int(os.getenv('BAD_ORIENTATION_BASE', 10)),
+    'bad_orientation_limit': int(os.getenv('BAD_ORIENTATION_LIMIT', 2)),
+    'empty_reminder_base': int(os.getenv('EMPTY_REMINDER_BASE', 10)),
+    'empty_reminder_limit': int(os.getenv('EMPTY_REMINDER_LIMIT', 2)),
+    'random_threshold_minutes': int(os.getenv('RANDOM_THRESHOLD_MINUTES', 5)),
+    'min_weight': int(os.getenv('MIN_WEIGHT', 710)),
+    'max_weight': int(os.getenv('MAX_WEIGHT', 1810)),
+    'empty_bottle_weight': int(os.getenv('EMPTY_BOTTLE_WEIGHT', 710)),
+    'full_bottle_weight': int(os.getenv('FULL_BOTTLE_WEIGHT', 1810)),
+    'empty_threshold': int(os.getenv('EMPTY_THRESHOLD', 50)),
+    'very_empty_threshold': int(os.getenv('VERY_EMPTY_THRESHOLD', 10)),
+    'fill_threshold_percent': int(os.getenv('FILL_THRESHOLD_PERCENT', 10)),
+    'drink_correction_threshold': int(os.getenv('DRINK_CORRECTION_THRESHOLD', 10)),
+    'bad_orientation_interval': int(os.getenv('BAD_ORIENTATION_INTERVAL', 10)),
+    'empty_reminder_interval': int(os.getenv('EMPTY_REMINDER_INTERVAL', 10)),
+    'recalibrate_reminder_days': int(os.getenv('RECALIBRATE_REMINDER_DAYS', 2)),
+    'min_timer_gap_minutes': int(os.getenv('MIN_TIMER_GAP_MINUTES', 1)),
+    'orientation_threshold': int(os.getenv('ORIENTATION_THRESHOLD', 10)),
+    'daily_goal_ml': int(os.getenv('DAILY_GOAL_IN_ML', 2000)),
+    'hydration_start_hour': int(os.getenv('HYDRATION_START_HOUR', 7)),
+    'hydration_end_hour': int(os.getenv('HYDRATION_END_HOUR', 22)),
+    'reasonable_ml_per_hour': int(os.getenv('REASONABLE_ML_PER_HOUR', 130)),
+    'simulator_mode': os.getenv('SIMULATOR_MODE', 'true').lower() == 'true',
+    'praise_window_minutes': float(os.getenv('PRAISE_WINDOW_MINUTES', 1.0)),
+}
+
 # Configuration class to handle settings
 class Configuration:
     def __init__(self):
@@ -23,34 +218,9 @@ class Configuration:
         self._load_from_storage()
     
     def _load_from_env(self):
-        """Load configuration from environment variables"""
-        self.reminder_timer_minutes = int(os.getenv('REMINDER_TIMER_MINUTES', 45))
-        self.drink_reminder_base = int(os.getenv('DRINK_REMINDER_BASE', 45))
-        self.drink_reminder_limit = int(os.getenv('DRINK_REMINDER_LIMIT', 10))
-        self.bad_orientation_base = int(os.getenv('BAD_ORIENTATION_BASE', 10))
-        self.bad_orientation_limit = int(os.getenv('BAD_ORIENTATION_LIMIT', 2))
-        self.empty_reminder_base = int(os.getenv('EMPTY_REMINDER_BASE', 10))
-        self.empty_reminder_limit = int(os.getenv('EMPTY_REMINDER_LIMIT', 2))
-        self.random_threshold_minutes = int(os.getenv('RANDOM_THRESHOLD_MINUTES', 5))
-        self.min_weight = int(os.getenv('MIN_WEIGHT', 710))
-        self.max_weight = int(os.getenv('MAX_WEIGHT', 1810))
-        self.empty_bottle_weight = int(os.getenv('EMPTY_BOTTLE_WEIGHT', 710))
-        self.full_bottle_weight = int(os.getenv('FULL_BOTTLE_WEIGHT', 1810))
-        self.empty_threshold = int(os.getenv('EMPTY_THRESHOLD', 50))
-        self.very_empty_threshold = int(os.getenv('VERY_EMPTY_THRESHOLD', 10))
-        self.fill_threshold_percent = int(os.getenv('FILL_THRESHOLD_PERCENT', 10))
-        self.drink_correction_threshold = int(os.getenv('DRINK_CORRECTION_THRESHOLD', 10))
-        self.bad_orientation_interval = int(os.getenv('BAD_ORIENTATION_INTERVAL', 10))
-        self.empty_reminder_interval = int(os.getenv('EMPTY_REMINDER_INTERVAL', 10))
-        self.recalibrate_reminder_days = int(os.getenv('RECALIBRATE_REMINDER_DAYS', 2))
-        self.min_timer_gap_minutes = int(os.getenv('MIN_TIMER_GAP_MINUTES', 1))
-        self.orientation_threshold = int(os.getenv('ORIENTATION_THRESHOLD', 10))
-        self.daily_goal_ml = int(os.getenv('DAILY_GOAL_IN_ML', 2000))
-        self.hydration_start_hour = int(os.getenv('HYDRATION_START_HOUR', 7))
-        self.hydration_end_hour = int(os.getenv('HYDRATION_END_HOUR', 22))
-        self.reasonable_ml_per_hour = int(os.getenv('REASONABLE_ML_PER_HOUR', 130))
-        self.simulator_mode = os.getenv('SIMULATOR_MODE', 'true').lower() == 'true'
-        self.praise_window_minutes = float(os.getenv('PRAISE_WINDOW_MINUTES', 1.0))
+        """Load configuration from environment variables (parsed once at import)"""
+        for key, value in _ENV_CONFIG.items():
+            setattr(self, key, value)
     
     def _load_from_storage(self):
         """Load configuration overrides from local storage"""
@@ -99,7 +269,6 @@ class Configuration:
             app_state['config_overrides'] = config_overrides
             
             # Save with current time and event counts
-            from time_service import time_service
             current_time = time_service.get_accurate_time()
             # We need access to event_manager, so this will be called from the app
             
@@ -110,6 +279,12 @@ class Configuration:
             return {}
 
 class DrinkReminderApp:
+    # Reactive UI data - bound UI elements are pushed an update only when these are assigned
+    weight_display_text = binding.BindableProperty()
+    status_display_text = binding.BindableProperty()
+    event_log_text = binding.BindableProperty()
+    hydration_status_text = binding.BindableProperty()
+    
     def __init__(self):
         # Initialize configuration
         self.config = Configuration()
@@ -139,6 +314,7 @@ class DrinkReminderApp:
         self.hydration_end_hour = self.config.hydration_end_hour
         self.reasonable_ml_per_hour = self.config.reasonable_ml_per_hour
         self.praise_window_minutes = self.config.praise_window_minutes
+        self._build_derived_config()
         
         # Application state
         self.current_weight = self.max_weight  # Start with full bottle
@@ -152,8 +328,29 @@ class DrinkReminderApp:
         # New hydration tracking state - dehydration level as core ground truth
         self.dehydration_level = 1.0  # Start with mild dehydration (realistic morning state)
         
+        # Debounced consumption persistence (see _request_consumption_save)
+        self._storage_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='storage')  # Single writer keeps saves in order
+        self._consumption_save_handle = None
+        self._pending_ml_delta = 0.0  # Consumption not yet added to lifetime stats
+        self._pending_drink_events = 0  # Drink events not yet added to lifetime stats
+        
+        # Sip coalescing - a burst of weight decreases is handled as one drink (see _queue_sip)
+        self._pending_sip_ml = 0.0
+        self._sip_flush_handle = None
+        self._sip_client = None  # UI client the burst came from, so the drink toast still reaches it
+        self._drink_event_task = None  # In-flight coalesced drink handler, cancelled by reset_session_data
+        
+        # Slider debouncing - a drag fires dozens of update events, only the trailing one is handled
+        self._weight_change_handle = None
+        self._pending_weight_event = None
+        self._accel_change_handle = None
+        
+        self._day_end_ts = 0.0  # Epoch time of the next local midnight after the last daily reset check
+        
         # Load daily consumption and reset date from storage
         app_state = storage.load_app_state()
+        # In-memory copy of lifetime stats, kept in step with each storage update (see _bump_lifetime_stats)
+        self._lifetime_stats = dict(app_state.get('lifetime_stats') or _DEFAULT_LIFETIME_STATS)
         self.daily_consumed_ml = app_state.get('daily_consumed_ml', 0.0)
         saved_reset_date = app_state.get('last_daily_reset')
         
@@ -165,27 +362,24 @@ class DrinkReminderApp:
                     self.last_daily_reset = datetime.fromisoformat(saved_reset_date).date()
                 else:
                     # Date string only
-                    from datetime import date
                     self.last_daily_reset = date.fromisoformat(saved_reset_date)
             except Exception as e:
                 print(f"⚠️ Error parsing saved reset date '{saved_reset_date}': {e}")
-                from datetime import datetime
                 self.last_daily_reset = datetime.now().date()
         else:
-            from datetime import datetime
             self.last_daily_reset = datetime.now().date()
         
         print(f"💧 Loaded daily consumption: {self.daily_consumed_ml}ml (last reset: {self.last_daily_reset})")
         
         # Force daily reset check on startup to handle overnight resets
-        from datetime import datetime
         current_date = datetime.now().date()
         if current_date != self.last_daily_reset:
             print(f"🌅 Startup daily reset needed: {self.last_daily_reset} -> {current_date}")
             self._check_daily_reset()
         
         self.reminder_window_start = None  # Track when current reminder window started
-        self.cumulative_hif_window = []  # Track drinks within current reminder window for cumulative HIF
+        self.cumulative_hif_window = []  # DrinkRecords within current reminder window for cumulative HIF
+        self._cumulative_hif_sum = 0.0  # Running total of amount_ml in cumulative_hif_window
         
         # Legacy dehydration severity (kept for compatibility)
         self.dehydration_severity = 0  # Will be replaced by dehydration_level
@@ -195,20 +389,37 @@ class DrinkReminderApp:
         self.timer_manager = TimerManager(self.min_timer_gap_minutes)
         
         # Reactive UI data - these will automatically update the UI when changed
-        self.ui_data = {
-            'weight_display': '',
-            'status_display': '',
-            'event_log': '',
-            'timer_status': [],
-            'hydration_status_display': ''
-        }
+        self.weight_display_text = ''
+        self.status_display_text = ''
+        self.event_log_text = ''
+        self.hydration_status_text = ''
+        self._event_log_key = None  # (length, last event id) of the rendered event log
+        # Slowly-changing display prefixes: (key, text)
+        self._weight_display_cache = (None, '')
+        self._status_prefix_cache = (None, '')
         
         # Praise system configuration
-        self.praise_window_drinks = []  # Track drinks within praise window
+        self.praise_window_drinks = deque()  # DrinkRecords within praise window (oldest first)
+        self._praise_window_sum = 0.0  # Running total of amount_ml in praise_window_drinks
         
         # Initialize time service and storage
         self.app_start_time = None
         self._data_refresh_task = None  # Store reference for cleanup
+        self._timer_panel_task = None  # Timer panel refresh task (see _start_timer_panel_task)
+        self.timer_rows = []  # Timer panel row labels, filled in by create_ui
+        self._recalibrate_dialogs = {}  # Client id -> very-empty recalibration dialog, created by create_ui
+        self._recalibrate_pending = False  # Set while a recalibration dialog is awaiting an answer
+        self._trigger_time_text = {}  # next_trigger_time -> "HH:MM:SS" for the timer panel
+        self._shutdown_task = None  # Graceful shutdown task scheduled by a signal, if any
+        self._shutdown_done = False  # Set once _graceful_shutdown has run
+        self._background_tasks = set()  # Fire-and-forget tasks, referenced until done (see _spawn)
+        self._timezone_debug_shown = False  # One-time timezone debug output in _calculate_dehydration_level
+        self._ui_dirty = asyncio.Event()  # Set by state changes to wake the refresh task
+        
+        # Per-minute caches for hydration calculations: (key, value) pairs
+        self._hydration_info_cache = (None, None)
+        self._dehydration_cache = (None, None)
+        self._reminder_interval_cache = (None, None)
         
         # Setup timers (but don't start them yet)
         self._setup_timers()
@@ -230,6 +441,12 @@ class DrinkReminderApp:
         except Exception as e:
             print(f"❌ Error loading bottle weight: {e}, using config default: {self.config.empty_bottle_weight}g")
             self.bottle_weight = self.config.empty_bottle_weight
+        self._update_drink_capacity()
+    
+    def _update_drink_capacity(self):
+        """Precompute 1 / drink capacity for _get_drink_level_percent; call whenever bottle_weight or max_weight change"""
+        max_drink = self.max_weight - self.bottle_weight
+        self._inv_max_drink = 1.0 / max_drink if max_drink > 0 else 0.0
     
     def save_config_to_storage(self):
         """Save current configuration to storage"""
@@ -247,7 +464,6 @@ class DrinkReminderApp:
                 else:
                     reset_date_str = str(self.last_daily_reset)
             else:
-                from datetime import date
                 reset_date_str = date.today().isoformat()
             
             storage.save_app_state(
@@ -281,6 +497,7 @@ class DrinkReminderApp:
                 self.min_weight = self.config.empty_bottle_weight
             if 'full_bottle_weight' in new_config:
                 self.max_weight = self.config.full_bottle_weight
+                self._update_drink_capacity()
                 
             # Update UI elements if they exist
             if hasattr(self, 'weight_slider'):
@@ -288,6 +505,9 @@ class DrinkReminderApp:
                 self.weight_slider.max = self.max_weight
                 self.weight_slider.update()
             
+            # Refresh values derived from the goal, hydration window and orientation threshold
+            self._build_derived_config()
+            
             # Save to storage
             self.save_config_to_storage()
             
@@ -295,6 +515,7 @@ class DrinkReminderApp:
             timer_related_configs = ['drink_reminder_base', 'drink_reminder_limit', 'bad_orientation_base', 
                                    'bad_orientation_limit', 'empty_reminder_base', 'empty_reminder_limit']
             if any(key in new_config for key in timer_related_configs):
+                self._build_interval_tables()
                 self._update_reminder_timer_interval()
                 self._update_empty_reminder_timer_interval()
                 self._update_bad_orientation_timer_interval()
@@ -310,7 +531,6 @@ class DrinkReminderApp:
         HYBRID APPROACH: Schedule daily reset at midnight + event-driven checks
         Perfect for embedded systems without RTC - combines efficiency with reliability
         """
-        from datetime import datetime, timedelta
         
         current_time = datetime.now()
         # Calculate next midnight
@@ -332,7 +552,7 @@ class DrinkReminderApp:
         # Create timer for exact midnight
         self._daily_reset_timer = asyncio.get_event_loop().call_later(
             seconds_until_midnight, 
-            lambda: asyncio.create_task(midnight_reset())
+            lambda: self._spawn(midnight_reset())
         )
     
     # ============================================================================
@@ -385,7 +605,7 @@ class DrinkReminderApp:
         
         self._daily_reset_timer = asyncio.get_event_loop().call_later(
             seconds, 
-            lambda: asyncio.create_task(periodic_check())
+            lambda: self._spawn(periodic_check())
         )
     
     def _embedded_rtc_approach(self):
@@ -409,32 +629,60 @@ class DrinkReminderApp:
         pass
     
     def _start_data_refresh_task(self):
-        """Start the periodic data refresh task for reactive UI updates"""
+        """Start the refresh task for reactive UI data.
+        
+        The task sleeps until a state change (weight, orientation, timer
+        callbacks) calls _request_ui_update(), and otherwise wakes just after
+        each minute boundary to keep time-based fields such as hours remaining
+        current. Lifetime stats render at most every 10 seconds; a skipped
+        stats render shortens the next wait so it lands within 10 seconds.
+        """
         # Don't start if already running
         if self._data_refresh_task and not self._data_refresh_task.done():
             return
             
         async def refresh_data():
+            last_stats_update = 0.0
+            stats_pending = False
+            last_refresh = 0.0
+            self._ui_dirty.set()  # Render immediately on start
             try:
                 while True:
-                    self._update_ui_data()
-                    
-                    # Update counters
-                    if hasattr(self, '_refresh_counter'):
-                        self._refresh_counter += 1
-                    else:
-                        self._refresh_counter = 0
+                    # Wake on state changes, or just after the next minute boundary - time-derived
+                    # fields come from the per-minute hydration cache, so they can't change sooner
+                    timeout = 60.05 - time.time() % 60
+                    if stats_pending:
+                        timeout = min(timeout, max(0.0, last_stats_update + 10.0 - time.monotonic()))
+                    try:
+                        await asyncio.wait_for(self._ui_dirty.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                    # At most one refresh per _UI_REFRESH_MIN_INTERVAL - requests arriving meanwhile
+                    # (e.g. a drag of the weight slider) are folded into the next refresh
+                    since_last = time.monotonic() - last_refresh
+                    if since_last < _UI_REFRESH_MIN_INTERVAL:
+                        await asyncio.sleep(_UI_REFRESH_MIN_INTERVAL - since_last)
+                    self._ui_dirty.clear()
+                    try:
+                        self._update_ui_data()
+                    except Exception as e:
+                        # Keep refreshing - one bad pass shouldn't freeze the displays for good
+                        _print_throttled('data_refresh', f"Error in data refresh: {e}")
+                    last_refresh = time.monotonic()
                     
                     # HYBRID DAILY RESET APPROACH (optimal for boards without RTC):
                     # 1. Scheduled timer at exact midnight (backup/primary)
                     # 2. Event-driven checks during activity (weight changes, timers)
                     # Result: 99.93% fewer checks + guaranteed reset reliability
                     
-                    # Update lifetime stats display every 10 seconds
-                    if self._refresh_counter % 10 == 0:  # Every 10 seconds
+                    # Update lifetime stats display at most every 10 seconds - a render skipped
+                    # here is picked up by the shortened wait above rather than the next minute
+                    if time.monotonic() - last_stats_update >= 10.0:
                         self._update_lifetime_stats_display()
-                    
-                    await asyncio.sleep(1.0)  # Update every 1 second for responsive timers
+                        last_stats_update = time.monotonic()
+                        stats_pending = False
+                    else:
+                        stats_pending = True
             except asyncio.CancelledError:
                 print("Data refresh task cancelled")
                 raise
@@ -443,22 +691,66 @@ class DrinkReminderApp:
         
         self._data_refresh_task = asyncio.create_task(refresh_data())
     
+    def _start_timer_panel_task(self):
+        """Start the task that refreshes the timer panel.
+        
+        The task wakes as soon as the TimerManager reports a change (activation,
+        reset, interval, trigger) and otherwise once a second for countdowns.
+        """
+        if self._timer_panel_task and not self._timer_panel_task.done():
+            return
+        
+        async def refresh_timer_panel():
+            try:
+                while True:
+                    # Re-read each pass - reset_session_data replaces the timer manager
+                    changed = self.timer_manager.changed
+                    try:
+                        await asyncio.wait_for(changed.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
+                    changed.clear()
+                    await self._update_timer_panel()
+            except asyncio.CancelledError:
+                print("Timer panel task cancelled")
+                raise
+        
+        self._timer_panel_task = asyncio.create_task(refresh_timer_panel())
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a fire-and-forget task, keeping a reference so it can't be garbage-collected mid-flight"""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+    
+    def _request_ui_update(self):
+        """Mark the UI data as stale so the refresh task recomputes it"""
+        self._ui_dirty.set()
+    
     def _update_ui_data(self):
         """Update reactive UI data properties - this will automatically update bound UI elements"""
-        # Update weight display
-        drink_grams = self._get_drink_level_grams()
-        drink_percent = self._get_drink_level_percent()
-        daily_progress = (self.daily_consumed_ml / self.daily_goal_ml) * 100
+        # Nobody is watching - skip formatting until a client connects or a tab is shown again
+        if not _has_visible_client():
+            return
+        
+        # Update weight display - the prefix is only rebuilt when the weights or goal change
+        weight_key = (self.current_weight, self.daily_consumed_ml, self.bottle_weight, self.max_weight, self.daily_goal_ml)
+        if weight_key != self._weight_display_cache[0]:
+            drink_grams = self._get_drink_level_grams()
+            drink_percent = self._get_drink_level_percent()
+            daily_progress = self.daily_consumed_ml * self._inv_daily_goal * 100
+            weight_prefix = f'Total: {self.current_weight}g | Drink: {drink_grams:.0f}g ({drink_percent:.1f}%) | Daily: {self.daily_consumed_ml:.0f}/{self.daily_goal_ml}ml ({daily_progress:.1f}%)'
+            self._weight_display_cache = (weight_key, weight_prefix)
+        else:
+            weight_prefix = self._weight_display_cache[1]
         
         # Get hydration window info for display
         hydration_info = self._get_hydration_window_info()
         
         # Add urgency indicator to daily progress
-        urgency_indicator = ""
-        if hydration_info['urgency_factor'] > 2.0:
-            urgency_indicator = " ⚠️ URGENT"
-        elif hydration_info['urgency_factor'] > 1.0:
-            urgency_indicator = " ⏰ High Priority"
+        urgency_index = bisect.bisect_left(_URGENCY_BOUNDS, hydration_info['urgency_factor'])
+        urgency_indicator = _URGENCY_INDICATORS[urgency_index]
         
         time_status = ""
         if hydration_info['time_status'] == "in_window":
@@ -472,124 +764,100 @@ class DrinkReminderApp:
         current_interval = self._get_dynamic_reminder_interval()
         reminder_info = f" | Next reminder: {current_interval}min"
         
-        self.ui_data['weight_display'] = f'Total: {self.current_weight}g | Drink: {drink_grams:.0f}g ({drink_percent:.1f}%) | Daily: {self.daily_consumed_ml:.0f}/{self.daily_goal_ml}ml ({daily_progress:.1f}%){time_status}{urgency_indicator}{reminder_info}'
+        self.weight_display_text = ''.join((weight_prefix, time_status, urgency_indicator, reminder_info))
         
         # Update status display - conditionally show orientation based on simulator mode
-        status_parts = []
-        
-        if self.config.simulator_mode:
-            orientation_status = "✅ Vertical" if self._is_bottle_vertical() else "⚠️ Tilted"
-            status_parts.append(orientation_status)
-        
-        empty_status = "🚨 Empty" if self.is_empty_state else "💧 Has Drink"
-        status_parts.append(empty_status)
+        is_vertical = self._is_bottle_vertical() if self.config.simulator_mode else None
+        status_key = (is_vertical, self.is_empty_state)
+        if status_key != self._status_prefix_cache[0]:
+            status_parts = []
+            
+            if is_vertical is not None:
+                orientation_status = "✅ Vertical" if is_vertical else "⚠️ Tilted"
+                status_parts.append(orientation_status)
+            
+            empty_status = "🚨 Empty" if self.is_empty_state else "💧 Has Drink"
+            status_parts.append(empty_status)
+            status_prefix = ' | '.join(status_parts)
+            self._status_prefix_cache = (status_key, status_prefix)
+        else:
+            status_prefix = self._status_prefix_cache[1]
         
         # Enhanced dehydration status with new dehydration level system
+        # (computed once per tick and reused for the hydration status display below)
         dehydration_level = self._calculate_dehydration_level()
         
-        if dehydration_level <= 0.5:
-            if hydration_info['urgency_factor'] > 2.0:
-                dehydration_status = f"💧 Well Hydrated but URGENT timing! (Level: {dehydration_level:.1f})"
-            else:
-                dehydration_status = f"💧 Well Hydrated (Level: {dehydration_level:.1f})"
-        elif dehydration_level <= 1.2:
-            if hydration_info['urgency_factor'] > 2.0:
-                dehydration_status = f"💧 Mild Dehydration + URGENT! (Level: {dehydration_level:.1f})"
-            else:
-                dehydration_status = f"💧 Mild Dehydration (Level: {dehydration_level:.1f})"
-        elif dehydration_level <= 2.0:
-            if hydration_info['urgency_factor'] > 2.0:
-                dehydration_status = f"⚠️ Moderate Dehydration + URGENT! (Level: {dehydration_level:.1f})"
-            else:
-                dehydration_status = f"⚠️ Moderate Dehydration (Level: {dehydration_level:.1f})"
-        else:
-            if hydration_info['urgency_factor'] > 2.0:
-                dehydration_status = f"🚨 Severe Dehydration + URGENT! (Level: {dehydration_level:.1f})"
-            else:
-                dehydration_status = f"🚨 Severe Dehydration (Level: {dehydration_level:.1f})"
-        
-        status_parts.append(dehydration_status)
-        self.ui_data['status_display'] = ' | '.join(status_parts)
-        
-        # Update event log
-        recent_events = self.event_manager.events[-10:]
-        log_text = ""
-        for event in reversed(recent_events):
-            time_str = event.timestamp.strftime("%H:%M:%S")
-            if event.timer_name:
-                log_text += f"[{time_str}] {event.timer_name}:{event.event_type} (#{event.severity})\n"
-            else:
-                log_text += f"[{time_str}] {event.event_type} (#{event.severity})\n"
-        
-        self.ui_data['event_log'] = log_text
+        long_status, status_emoji, status_text, urgency_text = _dehydration_labels(dehydration_level, urgency_index)
+        dehydration_status = f"{long_status} (Level: {dehydration_level:.1f})"
         
-        # Update timer status
-        self.ui_data['timer_status'] = self._get_timer_status()
+        self.status_display_text = ' | '.join((status_prefix, dehydration_status))
         
-        # Update hydration status display
-        dehydration_level = self._calculate_dehydration_level()
-        hydration_factor = hydration_info['urgency_factor'] if hydration_info else 0.0
-        
-        # Simplified hydration status display - combine into one clear message
-        if dehydration_level <= 0.5:
-            status_emoji = "💧✨"
-            status_text = "Well Hydrated"
-        elif dehydration_level <= 1.2:
-            status_emoji = "💧"
-            status_text = "Mild Dehydration"
-        elif dehydration_level <= 2.0:
-            status_emoji = "⚠️"
-            status_text = "Moderate Dehydration"
-        else:
-            status_emoji = "🚨"
-            status_text = "Severe Dehydration"
-        
-        # Add urgency context if needed
-        urgency_text = ""
-        if hydration_factor > 2.0:
-            urgency_text = " (URGENT!)"
-        elif hydration_factor > 1.0:
-            urgency_text = " (High Priority)"
+        # Update event log - only re-rendered when events were added, removed or replaced
+        recent_events = self.event_manager.recent_events()
+        event_log_key = (len(recent_events), id(recent_events[-1]) if recent_events else None)
+        if event_log_key != self._event_log_key:
+            self._event_log_key = event_log_key
+            log_text = "".join([
+                f"[{event.time_str}] {event.timer_name}:{event.event_type} (#{event.severity})\n" if event.timer_name
+                else f"[{event.time_str}] {event.event_type} (#{event.severity})\n"
+                for event in reversed(recent_events)
+            ])
+            
+            self.event_log_text = log_text
         
-        self.ui_data['hydration_status_display'] = f'{status_emoji} {status_text}{urgency_text} | Level: {dehydration_level:.1f}/3.0 | Daily: {self.daily_consumed_ml:.0f}/{self.daily_goal_ml}ml'
+        # Update hydration status display - combine into one clear message
+        self.hydration_status_text = f'{status_emoji} {status_text}{urgency_text} | Level: {dehydration_level:.1f}/3.0 | Daily: {self.daily_consumed_ml:.0f}/{self.daily_goal_ml}ml'
+    
+    @staticmethod
+    def _as_background(callback):
+        """Wrap a timer callback so code it runs knows it has no UI slot (see _show_toast)"""
+        async def run_in_background():
+            token = _IN_BACKGROUND_TASK.set(True)
+            try:
+                await callback()
+            finally:
+                _IN_BACKGROUND_TASK.reset(token)
+        return run_in_background
     
     def _setup_timers(self):
         """Setup all the application timers"""
-        # Main drink reminder timer - start with base interval, will be adjusted dynamically
-        self.timer_manager.add_timer(
-            'drink_reminder',
-            self.drink_reminder_base,  # Start with base interval
-            self._drink_reminder_callback,
-            self.random_threshold_minutes
-        )
-        
-        # Bad orientation timer - start with base interval, will be adjusted dynamically
-        self.timer_manager.add_timer(
-            'bad_orientation',
-            self.bad_orientation_base,
-            self._bad_orientation_callback
-        )
-        
-        # Empty reminder timer - start with base interval, will be adjusted dynamically
-        self.timer_manager.add_timer(
-            'empty_reminder',
-            self.empty_reminder_base,
-            self._empty_reminder_callback
-        )
-        
-        # Recalibrate reminder timer
-        self.timer_manager.add_timer(
-            'recalibrate_reminder',
-            self.recalibrate_reminder_days * 24 * 60,  # Convert days to minutes
-            self._recalibrate_reminder_callback
-        )
-        
-        # Initially deactivate some timers (this should happen after timers are added)
-        self.timer_manager.deactivate_timer('bad_orientation')
-        self.timer_manager.deactivate_timer('empty_reminder')
+        # One read of the saved timer states and one save for the whole setup; the save
+        # at the end of the block also records the initial deactivations below
+        with self.timer_manager.batched_saves():
+            # Main drink reminder timer - start with base interval, will be adjusted dynamically
+            self.timer_manager.add_timer(
+                'drink_reminder',
+                self.drink_reminder_base,  # Start with base interval
+                self._as_background(self._drink_reminder_callback),
+                self.random_threshold_minutes
+            )
+            
+            # Bad orientation timer - start with base interval, will be adjusted dynamically
+            self.timer_manager.add_timer(
+                'bad_orientation',
+                self.bad_orientation_base,
+                self._as_background(self._bad_orientation_callback)
+            )
+            
+            # Empty reminder timer - start with base interval, will be adjusted dynamically
+            self.timer_manager.add_timer(
+                'empty_reminder',
+                self.empty_reminder_base,
+                self._as_background(self._empty_reminder_callback)
+            )
+            
+            # Recalibrate reminder timer
+            self.timer_manager.add_timer(
+                'recalibrate_reminder',
+                self.recalibrate_reminder_days * 24 * 60,  # Convert days to minutes
+                self._as_background(self._recalibrate_reminder_callback)
+            )
+            
+            # Initially deactivate some timers (this should happen after timers are added)
+            self.timer_manager.deactivate_timer('bad_orientation')
+            self.timer_manager.deactivate_timer('empty_reminder')
         
-        # Save the initial state to ensure these timers stay deactivated
-        self.timer_manager._save_timer_states()
+        self._build_interval_tables()
     
     def _calculate_dehydration_level(self) -> float:
         """Calculate dehydration level based on actual hydration status over 24hr period.
@@ -600,17 +868,20 @@ class DrinkReminderApp:
                    2.0 = moderate dehydration  
                    3.0 = severe dehydration
         """
+        cache_key = self._hydration_cache_key()
+        if self._dehydration_cache[0] == cache_key:
+            return self._dehydration_cache[1]
+        
         # Get current hydration window info
         hydration_info = self._get_hydration_window_info()
         
-        # Use local time for calculations
-        from datetime import datetime
-        current_time_local = datetime.now()  # Local time
+        # Use local time for calculations (struct_time avoids a datetime allocation)
+        current_time_local = time.localtime()  # Local time
         hours_since_start = 0
         
         # Calculate how many hours we've been in the hydration window today
         if hydration_info['time_status'] == "in_window":
-            hours_since_start = current_time_local.hour - self.hydration_start_hour + (current_time_local.minute / 60.0)
+            hours_since_start = current_time_local.tm_hour - self.hydration_start_hour + (current_time_local.tm_min / 60.0)
         elif hydration_info['time_status'] == "after_window":
             hours_since_start = hydration_info['hours_in_window']  # Full hydration window has passed
         # If before_window, hours_since_start remains 0
@@ -620,15 +891,15 @@ class DrinkReminderApp:
         
         # Calculate hydration deficit as percentage of daily goal
         hydration_deficit = max(0, expected_ml - self.daily_consumed_ml)
-        deficit_percent = hydration_deficit / self.daily_goal_ml if self.daily_goal_ml > 0 else 0
+        deficit_percent = hydration_deficit * self._inv_daily_goal
         
         # One-time debug to confirm the timezone fix
-        if not hasattr(self, '_timezone_debug_shown'):
+        if not self._timezone_debug_shown:
             self._timezone_debug_shown = True
             utc_time = time_service.get_accurate_time()
             print(f"🕐 TIMEZONE FIX APPLIED:")
             print(f"   UTC time: {utc_time}")
-            print(f"   Local time: {current_time_local}")
+            print(f"   Local time: {time.strftime('%Y-%m-%d %H:%M:%S', current_time_local)}")
             print(f"   Time status: {hydration_info['time_status']}")
             print(f"   Hours since hydration start: {hours_since_start:.2f}")
             print(f"   Expected ML: {expected_ml:.0f}")
@@ -645,100 +916,120 @@ class DrinkReminderApp:
         else:  # 25%+ deficit
             dehydration_level = min(3.0, 2.0 + ((deficit_percent - 0.25) / 0.25) * 1.0)  # 2.0 to 3.0
         
+        self._dehydration_cache = (cache_key, dehydration_level)
         return dehydration_level
     
+    def _hydration_cache_key(self) -> tuple:
+        """Cache key for the hydration calculations.
+        
+        Results only depend on the current minute, daily consumption and the
+        hydration config, so the key changes whenever any of those do.
+        """
+        return (
+            int(time.time() // 60),
+            self.daily_consumed_ml,
+            self.daily_goal_ml,
+            self.hydration_start_hour,
+            self.hydration_end_hour,
+            self.reasonable_ml_per_hour,
+        )
+    
     def _get_dynamic_reminder_interval(self) -> int:
         """Calculate dynamic reminder interval based on dehydration level.
         
         Returns:
             int: Reminder interval in minutes
         """
+        cache_key = (self._hydration_cache_key(), self.drink_reminder_base, self.drink_reminder_limit)
+        if self._reminder_interval_cache[0] == cache_key:
+            return self._reminder_interval_cache[1]
+        
         dehydration_level = self._calculate_dehydration_level()
         
         # Linear interpolation between base and limit based on dehydration level
         # Level 0.0 (well hydrated) -> base interval (45 min)
         # Level 3.0 (severely dehydrated) -> limit interval (10 min)
-        if dehydration_level <= 0:
-            interval = self.drink_reminder_base
-        elif dehydration_level >= 3.0:
-            interval = self.drink_reminder_limit
-        else:
-            # Linear interpolation: interval = base - (base - limit) * (level / 3.0)
-            interval_range = self.drink_reminder_base - self.drink_reminder_limit
-            reduction = interval_range * (dehydration_level / 3.0)
-            interval = self.drink_reminder_base - reduction
+        # Levels outside 0.0-3.0 are handled by the clamp below
+        interval = self.drink_reminder_base - self._reminder_interval_slope * dehydration_level
         
         # Ensure we stay within bounds and return integer
-        return max(self.drink_reminder_limit, min(self.drink_reminder_base, int(interval)))
+        interval = max(self.drink_reminder_limit, min(self.drink_reminder_base, int(interval)))
+        self._reminder_interval_cache = (cache_key, interval)
+        return interval
     
     def _get_dynamic_empty_reminder_interval(self) -> int:
         """Calculate dynamic interval for empty reminders based on how many have been ignored"""
         # Get count of empty reminders that have been ignored
-        empty_reminder_count = self.event_manager.event_counts.get('empty_reminder:empty_reminder', 0)
-        
-        # Decrease interval as reminders are ignored (more urgent)
-        # Base 10min -> 8min -> 6min -> 4min -> 2min (limit)
-        interval_reduction = empty_reminder_count * 2  # 2 minutes per ignored reminder
-        dynamic_interval = self.empty_reminder_base - interval_reduction
+        empty_reminder_count = self.event_manager.get_count('empty_reminder', 'empty_reminder')
         
-        return max(self.empty_reminder_limit, dynamic_interval)
+        # Decrease interval as reminders are ignored (more urgent), see _build_interval_tables
+        intervals = self._empty_reminder_intervals
+        return intervals[min(empty_reminder_count, len(intervals) - 1)]
     
     def _get_dynamic_bad_orientation_interval(self) -> int:
         """Calculate dynamic interval for bad orientation reminders based on how many have been ignored"""
         # Get count of bad orientation reminders that have been ignored
-        bad_orientation_count = self.event_manager.event_counts.get('bad_orientation:bad_orientation', 0)
+        bad_orientation_count = self.event_manager.get_count('bad_orientation', 'bad_orientation')
         
-        # Decrease interval as reminders are ignored (more urgent)
-        # Base 10min -> 8min -> 6min -> 4min -> 2min (limit)
-        interval_reduction = bad_orientation_count * 2  # 2 minutes per ignored reminder
-        dynamic_interval = self.bad_orientation_base - interval_reduction
+        # Decrease interval as reminders are ignored (more urgent), see _build_interval_tables
+        intervals = self._bad_orientation_intervals
+        return intervals[min(bad_orientation_count, len(intervals) - 1)]
+    
+    def _build_derived_config(self):
+        """Precompute values derived from configuration (reciprocals, window length, orientation cosine)"""
+        self._inv_daily_goal = 1.0 / self.daily_goal_ml if self.daily_goal_ml > 0 else 0.0
+        self._inv_reasonable_ml_per_hour = 1.0 / self.reasonable_ml_per_hour if self.reasonable_ml_per_hour > 0 else 0.0
+        self._window_wraps = self.hydration_start_hour > self.hydration_end_hour
+        if not self._window_wraps:
+            self._hours_in_window = self.hydration_end_hour - self.hydration_start_hour
+        else:
+            self._hours_in_window = (24 - self.hydration_start_hour) + self.hydration_end_hour
+        # Within threshold degrees of vertical <=> |z| >= cos(threshold), so no acos per sample
+        self._cos_orientation_threshold = math.cos(math.radians(self.orientation_threshold))
+    
+    def _build_interval_tables(self):
+        """Precompute dynamic reminder intervals from the base/limit configuration.
+        
+        Ignored-count reminders drop by 2 minutes per ignored reminder down to the
+        limit (base 10min -> 8min -> 6min -> 4min -> 2min), so they are tabulated by
+        count; the last entry is the limit and applies to any higher count.
+        """
+        def ignored_count_intervals(base: int, limit: int) -> tuple:
+            steps = max(0, base - limit) // 2 + 2
+            return tuple(max(limit, base - 2 * count) for count in range(steps))
         
-        return max(self.bad_orientation_limit, dynamic_interval)
+        self._empty_reminder_intervals = ignored_count_intervals(self.empty_reminder_base, self.empty_reminder_limit)
+        self._bad_orientation_intervals = ignored_count_intervals(self.bad_orientation_base, self.bad_orientation_limit)
+        self._reminder_interval_slope = (self.drink_reminder_base - self.drink_reminder_limit) / 3.0
     
-    def _update_reminder_timer_interval(self):
-        """Update the drink reminder timer interval based on current dehydration level."""
+    def _update_reminder_timer_interval(self, dehydration_level: float = None):
+        """Update the drink reminder timer interval based on current dehydration level.
+        
+        Callers that just computed the dehydration level pass it in for the log line.
+        """
         new_interval = self._get_dynamic_reminder_interval()
         
         # Update timer interval if it has changed
-        if 'drink_reminder' in self.timer_manager.timers:
-            current_timer = self.timer_manager.timers['drink_reminder']
-            if current_timer.interval_minutes != new_interval:
-                current_timer.interval_minutes = new_interval
-                # Recalculate next trigger time based on new interval
-                current_time = time_service.get_accurate_time()
-                current_timer.next_trigger_time = self.timer_manager._calculate_next_trigger(current_timer, current_time)
-                self.timer_manager._save_timer_states()
-                print(f"🔄 Dynamic reminder interval updated to {new_interval} minutes (dehydration level: {self._calculate_dehydration_level():.1f})")
+        if self.timer_manager.update_interval('drink_reminder', new_interval):
+            if dehydration_level is None:
+                dehydration_level = self._calculate_dehydration_level()
+            print(f"🔄 Dynamic reminder interval updated to {new_interval} minutes (dehydration level: {dehydration_level:.1f})")
     
     def _update_empty_reminder_timer_interval(self):
         """Update the empty reminder timer interval based on how many reminders have been ignored."""
         new_interval = self._get_dynamic_empty_reminder_interval()
         
         # Update timer interval if it has changed
-        if 'empty_reminder' in self.timer_manager.timers:
-            current_timer = self.timer_manager.timers['empty_reminder']
-            if current_timer.interval_minutes != new_interval:
-                current_timer.interval_minutes = new_interval
-                # Recalculate next trigger time based on new interval
-                current_time = time_service.get_accurate_time()
-                current_timer.next_trigger_time = self.timer_manager._calculate_next_trigger(current_timer, current_time)
-                self.timer_manager._save_timer_states()
-                print(f"🔄 Empty reminder interval updated to {new_interval} minutes (ignored count: {self.event_manager.event_counts.get('empty_reminder:empty_reminder', 0)})")
+        if self.timer_manager.update_interval('empty_reminder', new_interval):
+            print(f"🔄 Empty reminder interval updated to {new_interval} minutes (ignored count: {self.event_manager.get_count('empty_reminder', 'empty_reminder')})")
     
     def _update_bad_orientation_timer_interval(self):
         """Update the bad orientation timer interval based on how many reminders have been ignored."""
         new_interval = self._get_dynamic_bad_orientation_interval()
         
         # Update timer interval if it has changed
-        if 'bad_orientation' in self.timer_manager.timers:
-            current_timer = self.timer_manager.timers['bad_orientation']
-            if current_timer.interval_minutes != new_interval:
-                current_timer.interval_minutes = new_interval
-                # Recalculate next trigger time based on new interval
-                current_time = time_service.get_accurate_time()
-                current_timer.next_trigger_time = self.timer_manager._calculate_next_trigger(current_timer, current_time)
-                self.timer_manager._save_timer_states()
-                print(f"🔄 Bad orientation interval updated to {new_interval} minutes (ignored count: {self.event_manager.event_counts.get('bad_orientation:bad_orientation', 0)})")
+        if self.timer_manager.update_interval('bad_orientation', new_interval):
+            print(f"🔄 Bad orientation interval updated to {new_interval} minutes (ignored count: {self.event_manager.get_count('bad_orientation', 'bad_orientation')})")
     
     async def initialize_app(self):
         """Initialize the application with time sync and storage"""
@@ -773,6 +1064,7 @@ class DrinkReminderApp:
             if self.reminder_window_start is None:
                 self.reminder_window_start = self.app_start_time
                 self.cumulative_hif_window = []
+                self._cumulative_hif_sum = 0.0
             
             # Set up dynamic reminder interval
             self._update_reminder_timer_interval()
@@ -790,8 +1082,8 @@ class DrinkReminderApp:
             # Setup signal handlers for graceful shutdown
             self._setup_signal_handlers()
             
-            # Cleanup old logs
-            storage.cleanup_old_logs(days=30)
+            # Cleanup old logs (on the storage thread, like the other startup writes)
+            self._submit_storage_write(storage.cleanup_old_logs, days=30)
             
             # Log app start event
             self.event_manager.trigger_event('app_started', {
@@ -802,7 +1094,8 @@ class DrinkReminderApp:
             })
             
             # Update lifetime stats for new session
-            storage.update_lifetime_stats(new_session=True)
+            self._bump_lifetime_stats(new_session=True)
+            self._submit_storage_write(storage.update_lifetime_stats, new_session=True)
             
             print("✅ App initialization complete")
             self._app_initialized = True
@@ -816,9 +1109,9 @@ class DrinkReminderApp:
     def _check_unexpected_shutdown(self):
         """Check if the previous session ended unexpectedly"""
         try:
-            app_state = storage.load_app_state()
-            start_count = app_state.get('event_counts', {}).get('app_started', 0)
-            shutdown_count = app_state.get('event_counts', {}).get('app_shutdown', 0)
+            # The event manager loaded these counts from app_state at startup - no need to re-read the file
+            start_count = self.event_manager.get_count('app_started')
+            shutdown_count = self.event_manager.get_count('app_shutdown')
             
             # If there are more starts than shutdowns, log unexpected shutdowns
             unexpected_shutdowns = start_count - shutdown_count
@@ -833,29 +1126,63 @@ class DrinkReminderApp:
         except Exception as e:
             print(f"Error checking for unexpected shutdowns: {e}")
     
+    def _on_signal(self, signum):
+        """Start a graceful shutdown for a termination signal (runs on the event loop)"""
+        print(f"📡 Received signal {signum}, initiating graceful shutdown...")
+        # Schedule graceful shutdown once - repeated signals (e.g. docker stop then kill) reuse the pending task
+        if self._shutdown_task is None or self._shutdown_task.done():
+            self._shutdown_task = asyncio.ensure_future(self._graceful_shutdown(f'signal_{signum}'))
+    
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            print(f"📡 Received signal {signum}, initiating graceful shutdown...")
-            # Schedule graceful shutdown
-            asyncio.create_task(self._graceful_shutdown(f'signal_{signum}'))
+        """Setup signal handlers for graceful shutdown.
+        
+        Must run on the event loop (called from initialize_app). Loop signal handlers run
+        between loop iterations, so the shutdown task is always created with a running loop.
+        """
+        # Common termination signals: Ctrl+C, termination request, hangup (Unix)
+        signums = [signal.SIGINT, signal.SIGTERM]
+        if hasattr(signal, 'SIGHUP'):
+            signums.append(signal.SIGHUP)
         
-        # Setup handlers for common termination signals
         try:
-            signal.signal(signal.SIGINT, signal_handler)   # Ctrl+C
-            signal.signal(signal.SIGTERM, signal_handler)  # Termination request
-            if hasattr(signal, 'SIGHUP'):
-                signal.signal(signal.SIGHUP, signal_handler)   # Hangup (Unix)
+            loop = asyncio.get_running_loop()
+            for signum in signums:
+                try:
+                    loop.add_signal_handler(signum, self._on_signal, signum)
+                except NotImplementedError:
+                    # Windows event loops don't support add_signal_handler - hand over to the loop thread-safely
+                    signal.signal(signum, lambda signum, frame: loop.call_soon_threadsafe(self._on_signal, signum))
         except Exception as e:
             print(f"Warning: Could not setup signal handlers: {e}")
         
         # Also register atexit handler as backup
         atexit.register(self._atexit_handler)
     
+    def _flush_pending_saves_sync(self):
+        """Write every debounced save now, for shutdown paths that won't return to the event loop"""
+        # Sips still waiting to be coalesced - too late for full drink handling, so just record the consumption
+        if self._sip_flush_handle is not None:
+            self._sip_flush_handle.cancel()
+            self._sip_flush_handle = None
+        folded_sips = self._pending_sip_ml > 0
+        if folded_sips:
+            amount_consumed_ml, self._pending_sip_ml = self._pending_sip_ml, 0.0
+            self.daily_consumed_ml += amount_consumed_ml
+            self._bump_lifetime_stats(ml_consumed=amount_consumed_ml, drink_events=1)
+            self._pending_ml_delta += amount_consumed_ml
+            self._pending_drink_events += 1
+        
+        self._flush_consumption()
+        if folded_sips and self._pending_drink_events:
+            self._save_consumption()
+        self.event_manager.flush()
+        self.timer_manager.flush()
+    
     def _atexit_handler(self):
         """Atexit handler for emergency shutdown logging"""
         try:
             # Quick logging without async - this is emergency fallback
+            self._flush_pending_saves_sync()
             if hasattr(self, 'event_manager') and self.event_manager:
                 self.event_manager.trigger_event('app_shutdown_atexit', {
                     'shutdown_time': time_service.get_accurate_time().isoformat(),
@@ -866,6 +1193,10 @@ class DrinkReminderApp:
     
     async def _graceful_shutdown(self, reason: str = 'unknown'):
         """Perform graceful shutdown with logging"""
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+        
         try:
             print(f"🔄 Graceful shutdown initiated: {reason}")
             
@@ -875,7 +1206,7 @@ class DrinkReminderApp:
                 'reason': reason
             })
             
-            # Save final state including bottle weight
+            # Save final state including bottle weight (debounced saves are flushed in finally)
             if self.app_start_time:
                 storage.save_app_state(self.app_start_time, self.event_manager.event_counts, self.bottle_weight)
             
@@ -883,14 +1214,24 @@ class DrinkReminderApp:
             if self._data_refresh_task and not self._data_refresh_task.done():
                 self._data_refresh_task.cancel()
                 try:
-                    await asyncio.wait_for(self._data_refresh_task, timeout=2.0)
+                    async with asyncio.timeout(2.0):
+                        await self._data_refresh_task
                 except (asyncio.CancelledError, asyncio.TimeoutError):
                     pass
             
+            # Cancel timer panel refresh task
+            if self._timer_panel_task and not self._timer_panel_task.done():
+                self._timer_panel_task.cancel()
+            
             # Cancel daily reset timer
             if hasattr(self, '_daily_reset_timer'):
                 self._daily_reset_timer.cancel()
             
+            # Let in-flight background tasks (session reset, initialization) finish their writes
+            pending = self._background_tasks - {asyncio.current_task()}
+            if pending:
+                await asyncio.wait(pending, timeout=2.0)
+            
             # Stop timer manager
             await self.timer_manager.stop()
             print("✅ Graceful shutdown complete")
@@ -900,6 +1241,12 @@ class DrinkReminderApp:
         finally:
             # Force exit if we're handling signals
             if reason.startswith('signal_'):
+                # os._exit skips atexit handlers, so make sure nothing debounced is left behind -
+                # flushed once here, after background tasks have queued their last saves
+                try:
+                    self._flush_pending_saves_sync()
+                except Exception as e:
+                    print(f"Error flushing pending saves: {e}")
                 os._exit(0)
     
     async def _drink_reminder_callback(self):
@@ -913,40 +1260,29 @@ class DrinkReminderApp:
         # Start new reminder window for cumulative HIF tracking
         self.reminder_window_start = time_service.get_accurate_time()
         self.cumulative_hif_window = []  # Clear previous window drinks
+        self._cumulative_hif_sum = 0.0
         
         # Get hydration window info for urgency context
         hydration_info = self._get_hydration_window_info()
         
         # Calculate severity based on dehydration level, not reminder count
         dehydration_level = self.dehydration_level
-        if dehydration_level >= 2.5:
-            severity_desc = "SEVERE"
-            urgency_emoji = "🚨"
-            severity_level = 20 + min(int(dehydration_level * 5), 10)  # 20-30 range
-        elif dehydration_level >= 1.5:
-            severity_desc = "MODERATE" 
-            urgency_emoji = "⚠️"
-            severity_level = 10 + min(int(dehydration_level * 5), 10)  # 10-20 range
-        elif dehydration_level >= 0.8:
-            severity_desc = "MILD"
-            urgency_emoji = "💧"
-            severity_level = 5 + min(int(dehydration_level * 5), 5)  # 5-10 range
-        else:
-            severity_desc = "MINIMAL"
-            urgency_emoji = "💧"
-            severity_level = max(1, int(dehydration_level * 5))  # 1-5 range
+        severity_desc, urgency_emoji, severity_level = _reminder_severity(dehydration_level)
         
         # Create more urgent reminder message if time is running out
-        if hydration_info['urgency_factor'] > 2.0 and hydration_info['time_status'] == "in_window":
-            reminder_message = f"{urgency_emoji} URGENT Drink Reminder! Only {hydration_info['hours_remaining']:.1f}h left! Need {hydration_info['remaining_ml_needed']:.0f}ml more! Dehydration: {severity_desc} ({dehydration_level:.1f})"
-        elif hydration_info['urgency_factor'] > 1.0 and hydration_info['time_status'] == "in_window":
-            reminder_message = f"{urgency_emoji} Priority Drink Reminder! {hydration_info['hours_remaining']:.1f}h remaining. Need {hydration_info['remaining_ml_needed']:.0f}ml. Dehydration: {severity_desc} ({dehydration_level:.1f})"
-        elif hydration_info['time_status'] == "after_window":
-            reminder_message = f"{urgency_emoji} Late Drink Reminder (after hydration hours). Dehydration: {severity_desc} ({dehydration_level:.1f})"
-        elif hydration_info['time_status'] == "before_window":
-            reminder_message = f"{urgency_emoji} Early Drink Reminder (before hydration hours). Dehydration: {severity_desc} ({dehydration_level:.1f})"
+        time_status = hydration_info['time_status']
+        if time_status == "in_window":
+            message_kind = _IN_WINDOW_REMINDER_KINDS[bisect.bisect_left(_URGENCY_BOUNDS, hydration_info['urgency_factor'])]
+        elif time_status in _REMINDER_MESSAGE_TEMPLATES:
+            message_kind = time_status
         else:
-            reminder_message = f"{urgency_emoji} Drink Reminder! Dehydration: {severity_desc} ({dehydration_level:.1f})"
+            message_kind = 'default'
+        reminder_message = _REMINDER_MESSAGE_TEMPLATES[message_kind].format(
+            emoji=urgency_emoji, hours=hydration_info['hours_remaining'], ml=hydration_info['remaining_ml_needed'],
+            desc=severity_desc, level=dehydration_level)
+        
+        # Let pending weight events and UI updates run before recording the reminder
+        await asyncio.sleep(0)
         
         event_data = {
             'dehydration_level': dehydration_level,
@@ -961,25 +1297,23 @@ class DrinkReminderApp:
                                                 custom_severity=severity_level)
         
         # Update reminder timer interval based on new dehydration level
-        self._update_reminder_timer_interval()
+        self._update_reminder_timer_interval(self.dehydration_level)
         
         # Log message instead of showing toast from background task
         print(f"DRINK REMINDER: {reminder_message}")
+        self._request_ui_update()
         
         # Play audio cue for drink reminder
         await audio_service.play_drink_reminder_audio(severity_level)
     
-    def _calculate_cumulative_hif(self, amount_consumed_ml: float) -> float:
+    def _calculate_cumulative_hif(self, amount_consumed_ml: float, hydration_info: dict) -> float:
         """Calculate cumulative hydration improvement factor based on amount consumed, dehydration severity, and time urgency."""
         # Base factor calculation
         if amount_consumed_ml <= 0:
             return 0.0
         
-        # Get hydration window info for time-based urgency
-        hydration_info = self._get_hydration_window_info()
-        
         # Factor based on amount relative to daily goal
-        amount_factor = min(amount_consumed_ml / (self.daily_goal_ml * 0.1), 1.0)  # 10% of daily goal = 1.0 factor
+        amount_factor = min(amount_consumed_ml * self._inv_daily_goal * 10, 1.0)  # 10% of daily goal = 1.0 factor
         
         # Factor based on dehydration severity (higher severity = higher factor potential)
         severity_multiplier = 1.0 + (self.dehydration_severity * 0.5)
@@ -993,29 +1327,29 @@ class DrinkReminderApp:
         
         return min(improvement_factor, 6.0)
     
-    def _clean_praise_window(self):
+    def _clean_praise_window(self, now: datetime = None):
         """Clean old drinks from praise window"""
-        current_time = time_service.get_accurate_time()
+        current_time = now or time_service.get_accurate_time()
         cutoff_time = current_time - timedelta(minutes=self.praise_window_minutes)
-        self.praise_window_drinks = [
-            drink for drink in self.praise_window_drinks 
-            if drink['timestamp'] > cutoff_time
-        ]
+        # Drinks are appended in time order, so expired ones are always at the left
+        while self.praise_window_drinks and self.praise_window_drinks[0].timestamp <= cutoff_time:
+            self._praise_window_sum -= self.praise_window_drinks.popleft().amount_ml
+        if not self.praise_window_drinks:
+            self._praise_window_sum = 0.0  # Drop accumulated float error
     
-    def _get_praise_message(self, amount_consumed_ml: float) -> tuple[str, str]:
+    def _get_praise_message(self, amount_consumed_ml: float, now: datetime = None) -> tuple[str, str]:
         """Generate praise message based on amount consumed and recent intake"""
+        current_time = now or time_service.get_accurate_time()
+        
         # Clean old drinks from praise window
-        self._clean_praise_window()
+        self._clean_praise_window(current_time)
         
         # Add current drink to praise window
-        current_time = time_service.get_accurate_time()
-        self.praise_window_drinks.append({
-            'amount_ml': amount_consumed_ml,
-            'timestamp': current_time
-        })
+        self.praise_window_drinks.append(DrinkRecord(amount_consumed_ml, current_time))
+        self._praise_window_sum += amount_consumed_ml
         
-        # Calculate cumulative intake in praise window
-        cumulative_ml = sum(drink['amount_ml'] for drink in self.praise_window_drinks)
+        # Cumulative intake in praise window
+        cumulative_ml = self._praise_window_sum
         drink_count = len(self.praise_window_drinks)
         
         # Base praise based on current drink amount
@@ -1054,82 +1388,63 @@ class DrinkReminderApp:
         else:
             return base_praise, base_type
     
-    def _get_hydration_message(self, amount_consumed_ml: float, improvement_factor: float) -> tuple[str, str]:
-        """Generate appropriate hydration message based on consumption, improvement factor, and time urgency"""
-        hydration_info = self._get_hydration_window_info()
-        
-        # Add time context to messages
-        time_context = ""
-        if hydration_info['time_status'] == "after_window":
-            time_context = " (after hydration hours)"
-        elif hydration_info['time_status'] == "before_window":
-            time_context = " (before hydration hours)"
-        elif hydration_info['urgency_factor'] > 2.0:
-            time_context = f" (⚠️ {hydration_info['hours_remaining']:.1f}h left!)"
-        elif hydration_info['urgency_factor'] > 1.0:
-            time_context = f" ({hydration_info['hours_remaining']:.1f}h remaining)"
-        
-        # Get cumulative amount in this reminder window for more context
-        total_window_amount = sum(drink['amount_ml'] for drink in self.cumulative_hif_window)
-        window_drinks_count = len(self.cumulative_hif_window)
-        
-        # Add window context for cumulative drinking
-        window_context = ""
-        if window_drinks_count > 1:
-            window_context = f" (Total this session: {total_window_amount:.0f}ml)"
-        
-        # Determine message type and content based on improvement factor
-        if improvement_factor >= 4.0:
-            # Very high improvement - excellent timing/amount
-            message = f"🌟 Outstanding! {amount_consumed_ml:.0f}ml at perfect timing! 💪{time_context}{window_context}"
-            message_type = "positive"
-        elif improvement_factor >= 3.0:
-            # High improvement - high praise
-            message = f"🎉 Excellent! You drank {amount_consumed_ml:.0f}ml! Great hydration boost! 💪{time_context}{window_context}"
-            message_type = "positive"
-        elif improvement_factor >= 2.0:
-            # Good improvement - moderate praise  
-            message = f"👍 Good job! You drank {amount_consumed_ml:.0f}ml. Keep up the good hydration! 💧{time_context}{window_context}"
-            message_type = "positive"
-        elif improvement_factor >= 1.0:
-            # Some improvement - encouragement
-            message = f"✅ Nice! You drank {amount_consumed_ml:.0f}ml. Your body appreciates it! 🙂{time_context}{window_context}"
-            message_type = "info"
-        elif improvement_factor >= 0.5:
-            # Small improvement - gentle encouragement (much more positive now with cumulative HIF)
-            message = f"💧 You drank {amount_consumed_ml:.0f}ml. Every sip counts! Keep going! 😊{time_context}{window_context}"
-            message_type = "info"
-        else:
-            # Very small improvement - still encouraging (less harsh than before)
-            message = f"🚰 You drank {amount_consumed_ml:.0f}ml. Building good habits! 💪{time_context}{window_context}"
-            message_type = "info"
-        
-        # Add urgency context for high urgency situations
-        if hydration_info['urgency_factor'] > 2.0 and hydration_info['time_status'] == "in_window":
-            if hydration_info['remaining_ml_needed'] > 0:
-                message += f" Need {hydration_info['remaining_ml_needed']:.0f}ml more!"
+    def _queue_sip(self, amount_consumed_ml: float, delay: float = 0.3):
+        """Accumulate consumption and handle it as one drink once no sip has arrived for delay seconds"""
+        self._pending_sip_ml += amount_consumed_ml
+        try:
+            self._sip_client = ui.context.client
+        except RuntimeError:
+            pass  # No UI context (background task) - toasts fall back to the console
         
-        return message, message_type
+        if self._sip_flush_handle is not None:
+            self._sip_flush_handle.cancel()
+        self._sip_flush_handle = asyncio.get_running_loop().call_later(delay, self._flush_sips)
+    
+    def _flush_sips(self):
+        """Hand the accumulated sips to _handle_drink_event as a single drink"""
+        self._sip_flush_handle = None
+        amount_consumed_ml, self._pending_sip_ml = self._pending_sip_ml, 0.0
+        client, self._sip_client = self._sip_client, None
+        self._drink_event_task = self._spawn(self._handle_coalesced_drink(amount_consumed_ml, client))
+    
+    async def _handle_coalesced_drink(self, amount_consumed_ml: float, client):
+        """Handle a coalesced drink in the UI context of the client it came from, if any"""
+        try:
+            if client is not None:
+                with client:
+                    await self._handle_drink_event(amount_consumed_ml)
+            else:
+                _IN_BACKGROUND_TASK.set(True)  # Scoped to this task's own context
+                await self._handle_drink_event(amount_consumed_ml)
+        except Exception as e:
+            print(f"Error handling drink event: {e}")
+        self._request_ui_update()
     
-    async def _handle_drink_event(self, amount_consumed_ml: float):
+    async def _handle_drink_event(self, amount_consumed_ml: float, now: datetime = None):
         """Handle a drink event with improved cumulative hydration improvement factor calculation"""
         if amount_consumed_ml <= 0:
             return
         
+        # One timestamp for the whole drink (praise window)
+        now = now or time_service.get_accurate_time()
+        
         # Get hydration window info for context
         hydration_info = self._get_hydration_window_info()
         
         # Calculate cumulative hydration improvement factor (new system)
-        improvement_factor = self._calculate_cumulative_hif(amount_consumed_ml)
+        improvement_factor = self._calculate_cumulative_hif(amount_consumed_ml, hydration_info)
         
         # Update daily consumption
         self.daily_consumed_ml += amount_consumed_ml
         
-        # Save daily consumption to storage
-        storage.save_daily_consumption(self.daily_consumed_ml, self.last_daily_reset.isoformat())
+        # Save daily consumption and lifetime stats (coalesced across a burst of drinks)
+        self._bump_lifetime_stats(ml_consumed=amount_consumed_ml, drink_events=1)
+        self._pending_ml_delta += amount_consumed_ml
+        self._pending_drink_events += 1
+        self._request_consumption_save()
         
-        # Update lifetime stats
-        storage.update_lifetime_stats(ml_consumed=amount_consumed_ml, drink_events=1)
+        # Yield between bookkeeping and the recalculation below so other tasks stay responsive
+        await asyncio.sleep(0)
         
         # Update dehydration level based on new consumption
         old_dehydration_level = self.dehydration_level
@@ -1140,7 +1455,7 @@ class DrinkReminderApp:
         self.dehydration_severity = max(0, self.dehydration_severity - severity_reduction)
         
         # Get praise message based on amount and recent drinking
-        message, message_type = self._get_praise_message(amount_consumed_ml)
+        message, message_type = self._get_praise_message(amount_consumed_ml, now)
         
         # Create drink event with rich data including new dehydration level system
         event_data = {
@@ -1152,9 +1467,9 @@ class DrinkReminderApp:
             'dehydration_severity_after': self.dehydration_severity,  # Legacy
             'daily_consumed_ml': self.daily_consumed_ml,
             'daily_goal_ml': self.daily_goal_ml,
-            'daily_progress_percent': (self.daily_consumed_ml / self.daily_goal_ml) * 100,
+            'daily_progress_percent': self.daily_consumed_ml * self._inv_daily_goal * 100,
             'hydration_window': hydration_info,
-            'cumulative_window_amount': sum(drink['amount_ml'] for drink in self.cumulative_hif_window),
+            'cumulative_window_amount': self._cumulative_hif_sum,
             'window_drinks_count': len(self.cumulative_hif_window)
         }
         
@@ -1165,31 +1480,99 @@ class DrinkReminderApp:
         self.timer_manager.reset_timer('drink_reminder')
         
         # Update reminder timer interval based on new dehydration level
-        self._update_reminder_timer_interval()
+        self._update_reminder_timer_interval(self.dehydration_level)
         
         print(f"🔄 Drink reminder timer reset due to consumption of {amount_consumed_ml:.0f}ml (new dehydration level: {self.dehydration_level:.1f})")
         
         # Show hydration message
-        await self._show_toast(f"{message} (Factor: {improvement_factor:.1f})", message_type)
+        self._show_toast(f"{message} (Factor: {improvement_factor:.1f})", message_type)
         
         # Play audio cue for praise
         await audio_service.play_praise_audio(improvement_factor)
         
         return event
     
-    def _calculate_hydration_improvement_factor(self, amount_consumed_ml: float) -> float:
-        """Calculate hydration improvement factor based on amount consumed, dehydration severity, and time urgency"""
-        # DEPRECATED: This method is replaced by _calculate_cumulative_hif for better UX
-        # Keeping for backward compatibility, but redirecting to new cumulative system
-        return self._calculate_cumulative_hif(amount_consumed_ml)
+    def _request_consumption_save(self, delay: float = 0.5):
+        """Schedule a coalesced save of daily consumption and lifetime stats (at most one write per delay)"""
+        if self._consumption_save_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running - save immediately
+            self._save_consumption()
+            return
+        self._consumption_save_handle = loop.call_later(delay, self._flush_consumption, False)
+    
+    def _flush_consumption(self, wait: bool = True):
+        """Write pending consumption now, cancelling any pending debounced save.
+        
+        With wait=False the write is queued on the storage thread so file I/O stays
+        off the event loop. With wait=True (shutdown, reset) queued writes are
+        drained first and the write happens in the calling thread.
+        """
+        pending = self._consumption_save_handle is not None
+        if pending:
+            self._consumption_save_handle.cancel()
+            self._consumption_save_handle = None
+        
+        if not wait:
+            if pending:
+                self._submit_storage_write(self._write_consumption, *self._take_pending_consumption())
+            return
+        
+        try:
+            self._storage_executor.submit(lambda: None).result()
+        except RuntimeError:
+            pass  # Executor already shut down at interpreter exit - nothing left in flight
+        if pending:
+            self._write_consumption(*self._take_pending_consumption())
+    
+    def _submit_storage_write(self, func, *args, **kwargs):
+        """Queue a storage write on the storage thread, in order with earlier writes"""
+        def write():
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                print(f"Error in background storage write: {e}")
+        self._storage_executor.submit(write)
+    
+    def _take_pending_consumption(self) -> tuple:
+        """Snapshot consumption to persist and clear the pending lifetime stats deltas"""
+        snapshot = (self._pending_ml_delta, self._pending_drink_events, self.daily_consumed_ml, self.last_daily_reset.isoformat())
+        self._pending_ml_delta = 0.0
+        self._pending_drink_events = 0
+        return snapshot
+    
+    def _save_consumption(self):
+        """Save daily consumption and pending lifetime stats in the calling thread"""
+        self._write_consumption(*self._take_pending_consumption())
+    
+    @staticmethod
+    def _write_consumption(ml_delta: float, drink_events: int, daily_consumed_ml: float, last_daily_reset: str):
+        """Save daily consumption and add drinks to lifetime stats"""
+        try:
+            if drink_events:
+                storage.update_lifetime_stats(ml_consumed=ml_delta, drink_events=drink_events)
+            storage.save_daily_consumption(daily_consumed_ml, last_daily_reset)
+        except Exception as e:
+            print(f"Error saving daily consumption: {e}")
     
     def _check_daily_reset(self):
         """Check if we need to reset daily consumption tracking"""
+        # Still the same local day as the last check - a float compare, no date objects
+        now = time.time()
+        if now < self._day_end_ts:
+            return
+        
         # Use local time for daily reset checking
-        from datetime import datetime
-        current_date = datetime.now().date()
+        current_date = date.fromtimestamp(now)
+        self._day_end_ts = time.mktime((current_date + timedelta(days=1)).timetuple())
         
         if current_date != self.last_daily_reset:
+            # Persist the previous day's pending drinks before resetting (queued ahead of the writes below)
+            self._flush_consumption(wait=False)
+            
             print(f"🌅 Daily reset triggered:")
             print(f"   Previous date: {self.last_daily_reset}")
             print(f"   Current date: {current_date}")
@@ -1197,7 +1580,8 @@ class DrinkReminderApp:
             
             # Update lifetime stats with yesterday's consumption before reset
             if self.daily_consumed_ml > 0:
-                storage.update_lifetime_stats(ml_consumed=self.daily_consumed_ml, new_day=True)
+                self._bump_lifetime_stats(ml_consumed=self.daily_consumed_ml, new_day=True)
+                self._submit_storage_write(storage.update_lifetime_stats, ml_consumed=self.daily_consumed_ml, new_day=True)
                 print(f"   Added {self.daily_consumed_ml}ml to lifetime stats")
             
             # Reset daily consumption
@@ -1205,7 +1589,7 @@ class DrinkReminderApp:
             self.last_daily_reset = current_date
             
             # Save the reset to storage
-            storage.save_daily_consumption(self.daily_consumed_ml, self.last_daily_reset.isoformat())
+            self._submit_storage_write(storage.save_daily_consumption, self.daily_consumed_ml, self.last_daily_reset.isoformat())
             
             # Reset to mild dehydration (realistic morning state) instead of 0
             # Humans naturally become mildly dehydrated overnight
@@ -1215,57 +1599,29 @@ class DrinkReminderApp:
             # Clear reminder window tracking for new day
             self.reminder_window_start = None
             self.cumulative_hif_window = []
+            self._cumulative_hif_sum = 0.0
             
             print(f"💧 Daily reset complete:")
             print(f"   Daily consumption: {self.daily_consumed_ml}ml")
             print(f"   Dehydration level: {self.dehydration_level}")
             print(f"   Last reset date: {self.last_daily_reset}")
     
-    def _is_in_hydration_window(self) -> bool:
-        """Check if current time is within active hydration window"""
-        current_time = time_service.get_accurate_time()
-        current_hour = current_time.hour
-        
-        if self.hydration_start_hour <= self.hydration_end_hour:
-            # Normal case: 7am-10pm
-            return self.hydration_start_hour <= current_hour < self.hydration_end_hour
-        else:
-            # Handles edge case if window crosses midnight (e.g., 22-6)
-            return current_hour >= self.hydration_start_hour or current_hour < self.hydration_end_hour
-    
-    def _get_hydration_window_info(self) -> dict:
-        """Get information about current hydration window and urgency"""
-        # Use local time for hydration window calculations
-        from datetime import datetime
-        current_time_local = datetime.now()  # Local time
-        current_hour = current_time_local.hour
-        current_minute = current_time_local.minute
-        
-        # Initialize hours_remaining to ensure it's always defined
-        hours_remaining = 0
+    def _compute_hours_remaining(self, current_time_local) -> tuple:
+        """Get (hours_remaining, time_status, hours_in_window) for the hydration window at a local struct_time"""
+        current_hour = current_time_local.tm_hour
+        current_minute = current_time_local.tm_min
+        hours_in_window = self._hours_in_window
         
         # Calculate time until end of hydration window
-        if self.hydration_start_hour <= self.hydration_end_hour:
-            # Normal case: 7am-10pm
-            if current_hour < self.hydration_start_hour:
-                # Before window starts
-                hours_until_start = self.hydration_start_hour - current_hour
-                hours_in_window = self.hydration_end_hour - self.hydration_start_hour
-                time_status = "before_window"
-                hours_remaining = hours_in_window  # Time available when window starts
-            elif current_hour >= self.hydration_end_hour:
-                # After window ends
-                hours_remaining = 0
-                hours_in_window = self.hydration_end_hour - self.hydration_start_hour
-                time_status = "after_window"
-            else:
-                # During window
-                hours_remaining = self.hydration_end_hour - current_hour - (current_minute / 60.0)
-                hours_in_window = self.hydration_end_hour - self.hydration_start_hour
-                time_status = "in_window"
+        if not self._window_wraps:
+            # Normal case: 7am-10pm - hours are whole, so comparing the fractional hour matches comparing the hour
+            now = current_hour + current_minute / 60.0
+            status_index = (now >= self.hydration_start_hour) + (now >= self.hydration_end_hour)
+            time_status = _WINDOW_STATUSES[status_index]
+            # Before window: time available when window starts; after window: none left
+            hours_remaining = (hours_in_window, self.hydration_end_hour - now, 0)[status_index]
         else:
             # Edge case: window crosses midnight
-            hours_in_window = (24 - self.hydration_start_hour) + self.hydration_end_hour
             if current_hour >= self.hydration_start_hour:
                 hours_remaining = (24 - current_hour) + self.hydration_end_hour - (current_minute / 60.0)
                 time_status = "in_window"
@@ -1276,9 +1632,10 @@ class DrinkReminderApp:
                 hours_remaining = 0
                 time_status = "after_window"
         
-        # Calculate hydration urgency
-        remaining_ml_needed = max(0, self.daily_goal_ml - self.daily_consumed_ml)
-        
+        return hours_remaining, time_status, hours_in_window
+    
+    def _compute_urgency(self, hours_remaining: float, time_status: str, hours_in_window: float, remaining_ml_needed: float) -> tuple:
+        """Get (urgency_factor, required_ml_per_hour) for the remaining goal and time"""
         if hours_remaining <= 0 or time_status == "after_window":
             urgency_factor = 0.0 if remaining_ml_needed == 0 else 5.0  # Max urgency if behind after window
             required_ml_per_hour = 0
@@ -1287,17 +1644,33 @@ class DrinkReminderApp:
             required_ml_per_hour = remaining_ml_needed / hours_in_window
         else:
             required_ml_per_hour = remaining_ml_needed / hours_remaining if hours_remaining > 0 else 0
-            urgency_factor = min(required_ml_per_hour / self.reasonable_ml_per_hour, 3.0)
+            urgency_factor = min(required_ml_per_hour * self._inv_reasonable_ml_per_hour, 3.0)
+        return urgency_factor, required_ml_per_hour
+    
+    def _get_hydration_window_info(self) -> dict:
+        """Get information about current hydration window and urgency"""
+        cache_key = self._hydration_cache_key()
+        if self._hydration_info_cache[0] == cache_key:
+            return self._hydration_info_cache[1]
+        
+        # Use local time for hydration window calculations (struct_time avoids a datetime allocation)
+        hours_remaining, time_status, hours_in_window = self._compute_hours_remaining(time.localtime())
         
-        return {
+        # Calculate hydration urgency
+        remaining_ml_needed = max(0, self.daily_goal_ml - self.daily_consumed_ml)
+        urgency_factor, required_ml_per_hour = self._compute_urgency(hours_remaining, time_status, hours_in_window, remaining_ml_needed)
+        
+        hydration_info = {
             'time_status': time_status,
             'hours_remaining': max(0, hours_remaining),
             'hours_in_window': hours_in_window,
             'remaining_ml_needed': remaining_ml_needed,
             'required_ml_per_hour': required_ml_per_hour,
             'urgency_factor': urgency_factor,
-            'progress_percent': (self.daily_consumed_ml / self.daily_goal_ml) * 100
+            'progress_percent': self.daily_consumed_ml * self._inv_daily_goal * 100
         }
+        self._hydration_info_cache = (cache_key, hydration_info)
+        return hydration_info
     
     async def _bad_orientation_callback(self):
         """Bad orientation reminder callback with dynamic interval adjustment"""
@@ -1309,6 +1682,7 @@ class DrinkReminderApp:
             
             # Log message instead of showing toast from background task
             print(f"BAD ORIENTATION: Warning #{event.severity} triggered at {event.timestamp}")
+            self._request_ui_update()
     
     async def _empty_reminder_callback(self):
         """Empty bottle reminder callback with dynamic interval adjustment"""
@@ -1320,28 +1694,26 @@ class DrinkReminderApp:
             
             # Log message instead of showing toast from background task
             print(f"EMPTY REMINDER: Warning #{event.severity} triggered at {event.timestamp}")
+            self._request_ui_update()
     
     async def _recalibrate_reminder_callback(self):
         """Recalibrate reminder callback"""
         # Check if very_empty event hasn't occurred in the last 2 days
+        last_very_empty = self.event_manager.get_latest_event('very_empty')
         recent_very_empty = None
-        for event in reversed(self.event_manager.events):
-            if event.event_type == 'very_empty':
-                if (datetime.now() - event.timestamp).days < self.recalibrate_reminder_days:
-                    recent_very_empty = event
-                break
+        if last_very_empty and (time_service.get_accurate_time() - last_very_empty.timestamp).days < self.recalibrate_reminder_days:
+            recent_very_empty = last_very_empty
         
         if not recent_very_empty:
             event = self.event_manager.trigger_event('recalibrate_reminder', timer_name='recalibrate_reminder')
             # Log message instead of showing toast from background task
             print(f"RECALIBRATE REMINDER: Reminder #{event.severity} triggered at {event.timestamp}")
+            self._request_ui_update()
     
     def _is_bottle_vertical(self) -> bool:
         """Check if bottle is within orientation threshold of vertical"""
-        # Calculate angle from vertical (z-axis should be ~1 for vertical)
-        z_normalized = abs(self.accelerometer['z'])
-        angle_from_vertical = math.degrees(math.acos(min(1.0, z_normalized)))
-        return angle_from_vertical <= self.orientation_threshold
+        # Angle from vertical is acos(|z|) (z-axis should be ~1 for vertical), compared via its cosine
+        return abs(self.accelerometer['z']) >= self._cos_orientation_threshold
     
     def _get_drink_level_grams(self) -> float:
         """Get the current drink level in grams (excluding bottle weight)"""
@@ -1349,12 +1721,15 @@ class DrinkReminderApp:
     
     def _get_drink_level_percent(self) -> float:
         """Get the current drink level as percentage of max capacity"""
-        max_drink = self.max_weight - self.bottle_weight
-        current_drink = self._get_drink_level_grams()
-        return (current_drink / max_drink) * 100 if max_drink > 0 else 0
+        return self._get_drink_level_grams() * self._inv_max_drink * 100
     
-    async def _show_toast(self, message: str, type_: str = 'info'):
+    def _show_toast(self, message: str, type_: str = 'info'):
         """Show a toast notification - safe for background tasks"""
+        if _IN_BACKGROUND_TASK.get():
+            # Known background task - no UI slot to notify in
+            print(f"TOAST [{type_.upper()}]: {message}")
+            return
+        
         try:
             # Use NiceGUI notification system
             ui.notify(
@@ -1374,20 +1749,41 @@ class DrinkReminderApp:
     async def reset_session_data(self, preserve_lifetime_stats: bool = True):
         """Reset current session data while preserving lifetime statistics"""
         try:
-            # Use storage reset function
-            success = storage.reset_session_data(preserve_lifetime_stats)
+            # Drop sips still being coalesced and any drink still being handled - they belong to the
+            # session being reset and would otherwise land in the fresh session's totals and events
+            if self._sip_flush_handle is not None:
+                self._sip_flush_handle.cancel()
+                self._sip_flush_handle = None
+            self._pending_sip_ml = 0.0
+            self._sip_client = None
+            if self._drink_event_task is not None and not self._drink_event_task.done():
+                self._drink_event_task.cancel()
+            self._drink_event_task = None
+            
+            # Write out pending debounced saves so they can't overwrite the reset afterwards -
+            # all on the storage thread, which runs them in order ahead of the reset itself
+            loop = asyncio.get_running_loop()
+            self._flush_consumption(wait=False)
+            await loop.run_in_executor(self._storage_executor, self.event_manager.flush)
+            await loop.run_in_executor(self._storage_executor, self.timer_manager.flush)
+            
+            # Use storage reset function (on the storage thread so the event loop stays responsive)
+            success = await loop.run_in_executor(self._storage_executor, storage.reset_session_data, preserve_lifetime_stats)
             
             if success:
                 # Reload data from storage after reset
-                app_state = storage.load_app_state()
+                app_state = await loop.run_in_executor(self._storage_executor, storage.load_app_state)
+                self._lifetime_stats = dict(app_state.get('lifetime_stats') or _DEFAULT_LIFETIME_STATS)
                 self.daily_consumed_ml = app_state.get('daily_consumed_ml', 0.0)
                 self.last_daily_reset = time_service.get_accurate_time().date()
+                self._day_end_ts = 0.0  # Re-check against the new reset date
                 
                 # Reset in-memory state
                 self.dehydration_level = 1.0
                 self.dehydration_severity = 0
                 self.reminder_window_start = None
                 self.cumulative_hif_window = []
+                self._cumulative_hif_sum = 0.0
                 
                 # Reload event manager with fresh data
                 self.event_manager = EventManager()
@@ -1395,45 +1791,47 @@ class DrinkReminderApp:
                 # Reset and restart timers
                 self.timer_manager = TimerManager(self.min_timer_gap_minutes)
                 self._setup_timers()
+                self._request_ui_update()
                 
-                await self._show_toast(f"✅ Session reset complete! {'Lifetime stats preserved' if preserve_lifetime_stats else 'All data reset'}", 'positive')
+                self._show_toast(f"✅ Session reset complete! {'Lifetime stats preserved' if preserve_lifetime_stats else 'All data reset'}", 'positive')
                 print(f"🔄 Session data reset. Daily consumption: {self.daily_consumed_ml}ml")
                 return True
             else:
-                await self._show_toast("❌ Failed to reset session data", 'error')
+                self._show_toast("❌ Failed to reset session data", 'error')
                 return False
                 
         except Exception as e:
             print(f"❌ Error resetting session: {e}")
-            await self._show_toast(f"❌ Reset error: {e}", 'error')
+            self._show_toast(f"❌ Reset error: {e}", 'error')
             return False
     
     def get_lifetime_stats(self) -> dict:
-        """Get lifetime statistics"""
-        app_state = storage.load_app_state()
-        return app_state.get('lifetime_stats', {
-            "total_sessions": 0,
-            "total_ml_consumed": 0.0,
-            "total_drink_events": 0,
-            "days_tracked": 0
-        })
+        """Get lifetime statistics (from memory - storage is only read at startup and after a reset)"""
+        return self._lifetime_stats
+    
+    def _bump_lifetime_stats(self, ml_consumed: float = 0, drink_events: int = 0, new_session: bool = False, new_day: bool = False):
+        """Apply a lifetime stats update in memory, mirroring storage.update_lifetime_stats"""
+        stats = self._lifetime_stats
+        if new_session:
+            stats["total_sessions"] += 1
+        if new_day:
+            stats["days_tracked"] += 1
+        if ml_consumed > 0:
+            stats["total_ml_consumed"] += ml_consumed
+        if drink_events > 0:
+            stats["total_drink_events"] += drink_events
     
     def _update_lifetime_stats_display(self):
         """Update the lifetime statistics display"""
         try:
             stats = self.get_lifetime_stats()
-            stats_text = f"""
-Sessions: {stats['total_sessions']}
-Total Consumed: {stats['total_ml_consumed']:.0f}ml
-Drink Events: {stats['total_drink_events']}
-Days Tracked: {stats['days_tracked']}
-Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
-            """.strip()
+            stats_text = _LIFETIME_STATS_TEMPLATE.format_map(
+                {**stats, 'avg_per_day': stats['total_ml_consumed'] / max(1, stats['days_tracked'])})
             
             if hasattr(self, 'lifetime_stats_label'):
                 self.lifetime_stats_label.text = stats_text
         except Exception as e:
-            print(f"Error updating lifetime stats display: {e}")
+            _print_throttled('lifetime_stats_display', f"Error updating lifetime stats display: {e}")
 
     def _save_event_counts(self):
         """Save current event counts to storage"""
@@ -1452,10 +1850,12 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
         drink_level = self._get_drink_level_grams()
         
         # Handle consumption (weight decreased)
+        sip_queued = False
         if weight_diff < 0:
             amount_consumed_ml = abs(weight_diff)  # 1g = 1ml for water
             if amount_consumed_ml >= 1:  # Only handle meaningful consumption
-                await self._handle_drink_event(amount_consumed_ml)
+                self._queue_sip(amount_consumed_ml)
+                sip_queued = True
         
         # Check for various events
         if drink_level <= self.very_empty_threshold:
@@ -1466,7 +1866,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             if not self.is_empty_state:
                 self.is_empty_state = True
                 event = self.event_manager.trigger_event('empty')
-                await self._show_toast(f'📉 Bottle is empty! (#{event.severity})', 'warning')
+                self._show_toast(f'📉 Bottle is empty! (#{event.severity})', 'warning')
                 # Activate empty reminder timer
                 self.timer_manager.activate_timer('empty_reminder')
                 self.timer_manager.reset_timer('empty_reminder')
@@ -1476,7 +1876,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                 self.is_empty_state = False
                 self.timer_manager.deactivate_timer('empty_reminder')
                 # Reset empty reminder count since issue is resolved
-                self.event_manager.event_counts['empty_reminder:empty_reminder'] = 0
+                self.event_manager.reset_count('empty_reminder', 'empty_reminder')
                 # Reset the timer so it starts fresh when activated again
                 self.timer_manager.reset_timer('empty_reminder')
                 print("🔄 Empty reminder count reset and timer reset - bottle refilled")
@@ -1489,15 +1889,15 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             if current_from_max <= max_capacity_threshold:
                 # Filled up to near max
                 event = self.event_manager.trigger_event('filled_up')
-                await self._show_toast(f'🌊 Bottle filled up! (#{event.severity})', 'positive')
+                self._show_toast(f'🌊 Bottle filled up! (#{event.severity})', 'positive')
             elif weight_diff <= self.drink_correction_threshold:
                 # Small increase - drink correction
                 event = self.event_manager.trigger_event('drink_correction', {'weight_diff': weight_diff})
-                await self._show_toast(f'🔧 Drink correction: +{weight_diff:.1f}g (#{event.severity})', 'info')
+                self._show_toast(f'🔧 Drink correction: +{weight_diff:.1f}g (#{event.severity})', 'info')
             else:
                 # Partial fill
                 event = self.event_manager.trigger_event('partial_fill', {'weight_diff': weight_diff})
-                await self._show_toast(f'💧 Partial fill: +{weight_diff:.1f}g (#{event.severity})', 'positive')
+                self._show_toast(f'💧 Partial fill: +{weight_diff:.1f}g (#{event.severity})', 'positive')
         
         # Check orientation and activate/deactivate bad orientation timer
         if not self._is_bottle_vertical():
@@ -1507,45 +1907,70 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             self.timer_manager.deactivate_timer('bad_orientation')
             if was_timer_active:
                 # Reset bad orientation reminder count since issue is resolved
-                self.event_manager.event_counts['bad_orientation:bad_orientation'] = 0
+                self.event_manager.reset_count('bad_orientation', 'bad_orientation')
                 # Reset the timer so it starts fresh when activated again
                 self.timer_manager.reset_timer('bad_orientation')
         
         self.previous_weight = self.current_weight
         
-        # Update dehydration level and dynamic reminder interval after any weight change
+        # Update dehydration level and dynamic reminder interval after any weight change.
+        # A queued sip hasn't reached daily_consumed_ml yet - the drink handler updates
+        # the interval once it has, so doing it here too would just repeat the work.
         old_dehydration_level = self.dehydration_level
         self.dehydration_level = self._calculate_dehydration_level()
         if abs(old_dehydration_level - self.dehydration_level) > 0.1:  # Only log significant changes
             print(f"🌊 Dehydration level updated: {old_dehydration_level:.1f} → {self.dehydration_level:.1f}")
-        self._update_reminder_timer_interval()
+        if not sip_queued:
+            self._update_reminder_timer_interval(self.dehydration_level)
         
+        self._request_ui_update()
 
     
     async def _handle_very_empty(self):
         """Handle very empty state with user confirmation"""
-        result = await ui.run_javascript('''
-            return confirm("Bottle appears to be completely empty. Recalibrate bottle weight?");
-        ''')
+        # The dialog no longer blocks the tab, so a second Submit could ask again while it's
+        # open - one click would then resume both and log the recalibration twice
+        if self._recalibrate_pending:
+            return
+        
+        # Ask on the page of the client that submitted the weight
+        try:
+            dialog = self._recalibrate_dialogs.get(ui.context.client.id)
+        except RuntimeError:
+            dialog = None  # No UI context - nobody to ask
+        
+        result = None
+        if dialog is not None:
+            self._recalibrate_pending = True
+            try:
+                # Resolves with the clicked button's value, or None if dismissed or the client
+                # disconnected (see on_disconnect); the timeout covers a client that just vanishes
+                async with asyncio.timeout(_RECALIBRATE_DIALOG_TIMEOUT):
+                    result = await dialog
+            except asyncio.TimeoutError:
+                dialog.close()
+            finally:
+                self._recalibrate_pending = False
         
         if result:
             # Recalibrate - set current weight as new bottle weight
             self.bottle_weight = self.current_weight
+            self._update_drink_capacity()
             self.is_empty_state = True
             
-            # Save the new bottle weight to persistent storage
-            storage.save_bottle_weight(self.bottle_weight)
+            # Save the new bottle weight to persistent storage (on the storage thread, in order with other writes)
+            self._submit_storage_write(storage.save_bottle_weight, self.bottle_weight)
             print(f"🔧 Bottle weight recalibrated and saved: {self.bottle_weight}g")
             
             event = self.event_manager.trigger_event('very_empty_recalibrated', {'new_bottle_weight': self.bottle_weight})
-            await self._show_toast(f'🔧 Recalibrated! New bottle weight: {self.bottle_weight}g (#{event.severity})', 'positive')
+            self._show_toast(f'🔧 Recalibrated! New bottle weight: {self.bottle_weight}g (#{event.severity})', 'positive')
             # Reset recalibrate timer
             self.timer_manager.reset_timer('recalibrate_reminder')
         else:
             event = self.event_manager.trigger_event('very_empty')
-            await self._show_toast(f'📉 Bottle very empty! (#{event.severity})', 'negative')
+            self._show_toast(f'📉 Bottle very empty! (#{event.severity})', 'negative')
     
-    async def on_weight_change(self, event=None):
+    def on_weight_change(self, event=None):
         """Callback for weight slider change"""
         # Get value from event args or slider directly
         if event and hasattr(event, 'args') and event.args:
@@ -1554,18 +1979,42 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             self.current_weight = self.weight_slider.value
         
         # print(f"Weight changed to: {self.current_weight}g")
+        self._request_ui_update()
+    
+    def _debounce_weight_change(self, event, delay: float = 0.05):
+        """Handle only the last weight slider event of a burst, delay seconds after it"""
+        self._pending_weight_event = event
+        if self._weight_change_handle is not None:
+            self._weight_change_handle.cancel()
+        self._weight_change_handle = asyncio.get_running_loop().call_later(delay, self._run_weight_change)
+    
+    def _run_weight_change(self):
+        """Hand the latest debounced weight slider event to on_weight_change"""
+        self._weight_change_handle = None
+        event, self._pending_weight_event = self._pending_weight_event, None
+        self.on_weight_change(event)
     
     async def on_submit_weight(self):
         """Callback for submit button"""
+        # Apply a weight change still waiting out its debounce before submitting
+        if self._weight_change_handle is not None:
+            self._weight_change_handle.cancel()
+            self._weight_change_handle = None
+            event, self._pending_weight_event = self._pending_weight_event, None
+            self.on_weight_change(event)
         print(f"Submit weight: Previous={self.previous_weight}g, Current={self.current_weight}g")
         await self._handle_weight_change()
     
-    async def on_accelerometer_change(self, event=None):
+    def on_accelerometer_change(self, event=None):
         """Callback for accelerometer changes"""
         # Check orientation and activate/deactivate bad orientation timer based on current orientation
         is_vertical = self._is_bottle_vertical()
         was_timer_active = self.timer_manager.timers['bad_orientation'].is_active
         
+        # Timer already matches the orientation - nothing to activate, reset or redraw
+        if was_timer_active != is_vertical:
+            return
+        
         if not is_vertical:
             self.timer_manager.activate_timer('bad_orientation')
             if not was_timer_active:  # Only log when status changes
@@ -1574,13 +2023,27 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             self.timer_manager.deactivate_timer('bad_orientation')
             if was_timer_active:  # Only log when status changes
                 # Reset bad orientation reminder count since issue is resolved
-                self.event_manager.event_counts['bad_orientation:bad_orientation'] = 0
+                self.event_manager.reset_count('bad_orientation', 'bad_orientation')
                 # Reset the timer so it starts fresh when activated again
                 self.timer_manager.reset_timer('bad_orientation')
                 print(f"🔄 Bottle vertical (z={self.accelerometer['z']:.1f}) - bad orientation timer deactivated and reset, count reset") 
         
-        # Update timer panel to reflect any activation changes
-        await self._update_timer_panel()
+        # Update status display; the timer panel task wakes on the activation change itself
+        self._request_ui_update()
+    
+    def _debounce_accelerometer_change(self, event=None, delay: float = 0.05):
+        """Run on_accelerometer_change once per burst of slider events, delay seconds after the last.
+        
+        The sliders are bound to self.accelerometer, so the trailing run sees the final values.
+        """
+        if self._accel_change_handle is not None:
+            self._accel_change_handle.cancel()
+        self._accel_change_handle = asyncio.get_running_loop().call_later(delay, self._run_accelerometer_change)
+    
+    def _run_accelerometer_change(self):
+        """Run the debounced accelerometer change"""
+        self._accel_change_handle = None
+        self.on_accelerometer_change()
     
     def _reset_axis(self, axis: str, value: float, slider):
         """Reset a single accelerometer axis to default value"""
@@ -1588,7 +2051,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
         slider.value = value
         # Force update the slider binding and then trigger change
         slider.update()
-        asyncio.create_task(self.on_accelerometer_change())
+        self.on_accelerometer_change()
     
     def _reset_all_axes(self, x_slider, y_slider, z_slider):
         """Reset all accelerometer axes to vertical position (default)"""
@@ -1602,34 +2065,27 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
         x_slider.update()
         y_slider.update()
         z_slider.update()
-        asyncio.create_task(self.on_accelerometer_change())
+        self.on_accelerometer_change()
     
     def _get_timer_status(self):
         """Get current timer status for UI display"""
         timer_status = []
         current_time = time_service.get_accurate_time()
+        dehydration_level = None  # Computed on first use below
         
         for name, timer in self.timer_manager.timers.items():
             # Skip simulator-only timers if simulator mode is disabled
-            if not self.config.simulator_mode and name in ['bad_orientation', 'empty_reminder']:
+            if not self.config.simulator_mode and name in _SIMULATOR_ONLY_TIMERS:
                 continue
                 
             status = "🟢 ACTIVE" if timer.is_active else "🔴 INACTIVE"
             
             if timer.next_trigger_time and timer.is_active:
                 time_diff = timer.next_trigger_time - current_time
-                if time_diff.total_seconds() > 0:
-                    total_seconds = int(time_diff.total_seconds())
-                    hours = total_seconds // 3600
-                    minutes = (total_seconds % 3600) // 60
-                    seconds = total_seconds % 60
-                    
-                    if hours > 0:
-                        countdown = f"{hours}h {minutes}m {seconds}s"
-                    elif minutes > 0:
-                        countdown = f"{minutes}m {seconds}s"
-                    else:
-                        countdown = f"{seconds}s"
+                total_seconds = time_diff.total_seconds()
+                if total_seconds > 0:
+                    total_seconds = int(total_seconds)
+                    countdown = _SECONDS_TEXT[total_seconds] if total_seconds < 60 else _format_countdown(total_seconds)
                 else:
                     countdown = "⚠️ OVERDUE"
             else:
@@ -1638,63 +2094,60 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             # Calculate current severity for this timer
             if name == 'drink_reminder':
                 # For drink reminders, severity is based on hydration level
-                dehydration_level = self._calculate_dehydration_level()
-                if dehydration_level >= 2.5:
-                    severity = 20 + min(int(dehydration_level * 5), 10)  # 20-30 range
-                    severity_display = f"🚨 {severity}"
-                elif dehydration_level >= 1.5:
-                    severity = 10 + min(int(dehydration_level * 5), 10)  # 10-20 range
-                    severity_display = f"⚠️ {severity}"
-                elif dehydration_level >= 0.8:
-                    severity = 5 + min(int(dehydration_level * 5), 5)  # 5-10 range
-                    severity_display = f"💧 {severity}"
-                else:
-                    severity = max(1, int(dehydration_level * 5))  # 1-5 range
-                    severity_display = f"💧 {severity}"
+                if dehydration_level is None:
+                    dehydration_level = self._calculate_dehydration_level()
+                severity_display = _drink_severity_display(dehydration_level)
             else:
                 # For other timers, severity is based on ignored count
-                count_key = f"{name}:{name}"
-                current_count = self.event_manager.event_counts.get(count_key, 0)
-                if current_count == 0:
-                    severity_display = "-"
-                elif current_count >= 10:
-                    severity_display = f"🚨 {current_count}"
-                elif current_count >= 5:
-                    severity_display = f"⚠️ {current_count}"
-                else:
-                    severity_display = f"📊 {current_count}"
-            
-            timer_status.append({
-                'name': name.replace('_', ' ').title(),
-                'status': status,
-                'interval': f"{timer.interval_minutes}m",
-                'countdown': countdown,
-                'next_trigger': timer.next_trigger_time.strftime('%H:%M:%S') if timer.next_trigger_time else "N/A",
-                'severity': severity_display
-            })
+                severity_display = _count_severity_display(self.event_manager.get_count(name, name))
+            
+            # Trigger times only move on trigger/reset, so format each one once
+            next_trigger = "N/A"
+            if timer.next_trigger_time:
+                next_trigger = self._trigger_time_text.get(timer.next_trigger_time)
+                if next_trigger is None:
+                    if len(self._trigger_time_text) > 32:
+                        self._trigger_time_text.clear()
+                    next_trigger = timer.next_trigger_time.strftime('%H:%M:%S')
+                    self._trigger_time_text[timer.next_trigger_time] = next_trigger
+            
+            timer_status.append(TimerRow(
+                name=_timer_display_name(name),
+                status=status,
+                interval=_interval_display(timer.interval_minutes),
+                countdown=countdown,
+                severity=severity_display,
+                next_trigger=next_trigger,
+            ))
         
         return timer_status
     
     async def _update_timer_panel(self):
         """Update the timer panel display"""
+        if not self.timer_rows:
+            _print_throttled('timer_rows_missing', "Warning: timer_rows not available yet", interval=60.0)
+            return
+        
+        # Nobody is watching - the next tick after a connect or tab show catches up
+        if not _has_visible_client():
+            return
+        
         try:
-            if hasattr(self, 'timer_rows') and self.timer_rows:
-                timer_status = self._get_timer_status()
-                
-                # Update each row
-                for i, status in enumerate(timer_status):
-                    if i < len(self.timer_rows):
-                        row = self.timer_rows[i]
-                        row['name'].text = status['name']
-                        row['status'].text = status['status']
-                        row['interval'].text = status['interval']
-                        row['countdown'].text = status['countdown']
-                        row['severity'].text = status['severity']
-                        row['next_trigger'].text = status['next_trigger']
-            else:
-                print("Warning: timer_rows not available yet")
+            timer_status = self._get_timer_status()
+            
+            # Update each row - only the labels whose text changed since the last pass
+            for i, status in enumerate(timer_status):
+                if i < len(self.timer_rows):
+                    row = self.timer_rows[i]
+                    rendered = row.get('rendered')
+                    if rendered == status:
+                        continue
+                    for j, field in enumerate(TimerRow._fields):
+                        if rendered is None or rendered[j] != status[j]:
+                            row[field].text = status[j]
+                    row['rendered'] = status
         except Exception as e:
-            print(f"Error updating timer panel: {e}")
+            _print_throttled('timer_panel', f"Error updating timer panel: {e}")
             
     def create_settings_modal(self):
         """Create the settings configuration modal"""
@@ -1849,10 +2302,10 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                         ui.label('Reset current session data:').classes('text-sm mb-2')
                         with ui.row().classes('w-full gap-2'):
                             ui.button('Reset Session (Keep Lifetime Stats)', 
-                                     on_click=lambda: asyncio.create_task(self.reset_session_data(preserve_lifetime_stats=True))
+                                     on_click=lambda: self._spawn(self.reset_session_data(preserve_lifetime_stats=True))
                                      ).classes('flex-1 bg-orange-500')
                             ui.button('Complete Reset (All Data)', 
-                                     on_click=lambda: asyncio.create_task(self.reset_session_data(preserve_lifetime_stats=False))
+                                     on_click=lambda: self._spawn(self.reset_session_data(preserve_lifetime_stats=False))
                                      ).classes('flex-1 bg-red-600')
                         ui.label('⚠️ Use reset if you notice incorrect hydration levels or accumulated errors.').classes('text-xs text-gray-500 mt-2')
             
@@ -1871,21 +2324,35 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                         success = self.update_config_from_ui(new_config)
                         
                         if success:
-                            await self._show_toast('✅ Configuration saved successfully!', 'positive')
+                            self._show_toast('✅ Configuration saved successfully!', 'positive')
                             settings_dialog.close()
                             
                             # Refresh UI if simulator mode changed
                             if 'simulator_mode' in new_config:
                                 await self._update_simulator_mode_visibility()
                         else:
-                            await self._show_toast('❌ Failed to save configuration', 'negative')
+                            self._show_toast('❌ Failed to save configuration', 'negative')
                     except Exception as e:
-                        await self._show_toast(f'❌ Error saving settings: {e}', 'negative')
+                        self._show_toast(f'❌ Error saving settings: {e}', 'negative')
                 
                 ui.button('Save', on_click=save_settings).classes('bg-blue-600')
         
         return settings_dialog
     
+    def create_recalibrate_dialog(self):
+        """Create the very-empty recalibration confirmation dialog.
+        
+        Replaces a JS confirm(), which froze the browser tab - and with it all
+        live UI updates - until answered.
+        """
+        with ui.dialog() as recalibrate_dialog, ui.card().classes('p-6'):
+            ui.label('Bottle appears to be completely empty. Recalibrate bottle weight?').classes('mb-4')
+            with ui.row().classes('w-full justify-end gap-4'):
+                ui.button('Cancel', on_click=lambda: recalibrate_dialog.submit(False)).classes('bg-gray-500')
+                ui.button('Recalibrate', on_click=lambda: recalibrate_dialog.submit(True)).classes('bg-blue-600')
+        
+        return recalibrate_dialog
+    
     async def _update_simulator_mode_visibility(self):
         """Update visibility of simulator mode elements"""
         try:
@@ -1918,8 +2385,22 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
 
 
 
+    def _on_page_visibility(self, e):
+        """Track hidden browser tabs so refreshes can be skipped while nobody can see them"""
+        if e.args:
+            _HIDDEN_CLIENT_IDS.discard(e.client.id)
+            # Catch up on everything skipped while hidden
+            self._request_ui_update()
+            self.timer_manager.changed.set()
+        else:
+            _HIDDEN_CLIENT_IDS.add(e.client.id)
+    
     def create_ui(self):
         """Create the main UI"""
+        # Report tab visibility changes back to the server
+        ui.add_body_html(_VISIBILITY_SCRIPT)
+        ui.on('page_visibility', self._on_page_visibility)
+        
         # Set initial page title based on simulator mode
         page_title = 'Drink Reminder Simulator' if self.config.simulator_mode else 'Drink Reminder'
         ui.page_title(page_title)
@@ -1934,6 +2415,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                 # Settings button
                 settings_dialog = self.create_settings_modal()
                 ui.button('⚙️', on_click=settings_dialog.open).props('flat round size=md').classes('ml-auto')
+                self._recalibrate_dialogs[ui.context.client.id] = self.create_recalibrate_dialog()
             
             # Responsive two-column layout
             with ui.row().classes('w-full gap-6'):
@@ -1951,13 +2433,13 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                         ).props('label-always').classes('mb-4')
                         
                         # Use proper event binding that passes the value
-                        self.weight_slider.on('update:model-value', lambda e: asyncio.create_task(self.on_weight_change(e)))
+                        self.weight_slider.on('update:model-value', self._debounce_weight_change)
                         
                         ui.button('Submit Weight Change', on_click=self.on_submit_weight).classes('mb-4 w-full')
                         
                         # Bind weight display to reactive data
                         self.weight_display = ui.label().classes('text-lg font-mono')
-                        self.weight_display.bind_text_from(self.ui_data, 'weight_display')
+                        self.weight_display.bind_text_from(self, 'weight_display_text')
                     
                     # Accelerometer Controls (conditionally shown based on simulator mode)
                     self.accelerometer_card = ui.card().classes('mb-4 p-4')
@@ -1969,7 +2451,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                             ui.label('X-Axis (Side to Side)').classes('font-medium text-gray-700 mb-2')
                             x_slider = ui.slider(min=-1, max=1, value=0, step=0.1).props('label-always').classes('mb-2')
                             x_slider.bind_value_to(self.accelerometer, 'x')
-                            x_slider.on('update:model-value', lambda e: asyncio.create_task(self.on_accelerometer_change(e)))
+                            x_slider.on('update:model-value', self._debounce_accelerometer_change)
                             
                             with ui.row().classes('gap-2 items-center'):
                                 ui.label('Left: -1.0').classes('text-xs text-gray-500 flex-1')
@@ -1981,7 +2463,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                             ui.label('Y-Axis (Forward/Backward)').classes('font-medium text-gray-700 mb-2')
                             y_slider = ui.slider(min=-1, max=1, value=0, step=0.1).props('label-always').classes('mb-2')
                             y_slider.bind_value_to(self.accelerometer, 'y')
-                            y_slider.on('update:model-value', lambda e: asyncio.create_task(self.on_accelerometer_change(e)))
+                            y_slider.on('update:model-value', self._debounce_accelerometer_change)
                             
                             with ui.row().classes('gap-2 items-center'):
                                 ui.label('Back: -1.0').classes('text-xs text-gray-500 flex-1')
@@ -1993,7 +2475,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                             ui.label('Z-Axis (Up/Down - Gravity)').classes('font-medium text-gray-700 mb-2')
                             z_slider = ui.slider(min=-1, max=1, value=1, step=0.1).props('label-always').classes('mb-2')
                             z_slider.bind_value_to(self.accelerometer, 'z')
-                            z_slider.on('update:model-value', lambda e: asyncio.create_task(self.on_accelerometer_change(e)))
+                            z_slider.on('update:model-value', self._debounce_accelerometer_change)
                             
                             with ui.row().classes('gap-2 items-center'):
                                 ui.label('Down: -1.0').classes('text-xs text-gray-500 flex-1')
@@ -2014,12 +2496,12 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                         ui.label('📊 Status').classes('text-xl font-semibold mb-4')
                         # Bind status display to reactive data
                         self.status_display = ui.label().classes('text-lg mb-3')
-                        self.status_display.bind_text_from(self.ui_data, 'status_display')
+                        self.status_display.bind_text_from(self, 'status_display_text')
                         
                         # Hydration Status Scale
                         ui.label('💧 Hydration Status').classes('text-lg font-semibold mb-2')
                         self.hydration_status_display = ui.label().classes('text-md')
-                        self.hydration_status_display.bind_text_from(self.ui_data, 'hydration_status_display')
+                        self.hydration_status_display.bind_text_from(self, 'hydration_status_text')
                         
                         # Lifetime Stats (if available)
                         with ui.expansion('📊 Lifetime Statistics', icon='analytics').classes('w-full mt-4'):
@@ -2030,7 +2512,7 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                     with ui.card().classes('mb-4 p-4'):
                         with ui.row().classes('w-full items-center justify-between mb-4'):
                             ui.label('⏰ Timer Status').classes('text-xl font-semibold')
-                            ui.button('🔄', on_click=lambda: asyncio.create_task(self._update_timer_panel())).props('flat round size=sm').classes('ml-auto')
+                            ui.button('🔄', on_click=lambda: self._spawn(self._update_timer_panel())).props('flat round size=sm').classes('ml-auto')
                         
                         # Timer table header
                         with ui.row().classes('w-full gap-2 mb-2 text-sm font-semibold text-gray-600'):
@@ -2068,11 +2550,12 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
                         ui.label('📋 Event Log').classes('text-xl font-semibold mb-4')
                         # Bind event log to reactive data
                         self.event_log = ui.textarea().classes('w-full mb-4').props('readonly rows=8')
-                        self.event_log.bind_value_from(self.ui_data, 'event_log')
+                        self.event_log.bind_value_from(self, 'event_log_text')
                         
                         with ui.row().classes('gap-2 w-full'):
                             async def clear_events():
                                 self.event_manager.clear_events()
+                                self._request_ui_update()
                             
                             ui.button('Clear Events', on_click=clear_events).classes('bg-red-500 flex-1')
                             
@@ -2086,11 +2569,11 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
         print("Info: UI elements created, reactive system will handle updates")
         
         # Initialize app (time sync, etc.) after UI is ready
-        asyncio.create_task(self.initialize_app())
+        self._spawn(self.initialize_app())
         
         # Immediate timer panel update
         print("Info: Scheduling immediate timer panel update")
-        asyncio.create_task(self._update_timer_panel())
+        self._spawn(self._update_timer_panel())
         
         # Start timer panel updates with real-time refresh (every 2 seconds)
         async def delayed_timer_setup():
@@ -2098,10 +2581,10 @@ Avg per Day: {stats['total_ml_consumed'] / max(1, stats['days_tracked']):.0f}ml
             print("Info: Running delayed timer setup")
             await self._update_timer_panel()
         
-        asyncio.create_task(delayed_timer_setup())
+        self._spawn(delayed_timer_setup())
         
-        # Create the auto-refresh timer in the main UI context (every 1 second for real-time updates)
-        ui.timer(1.0, callback=lambda: asyncio.create_task(self._update_timer_panel()))
+        # Refresh the timer panel on timer state changes, and every second for the countdowns
+        self._start_timer_panel_task()
         
         # Start the data refresh task now that the UI context is available
         self._start_data_refresh_task()
@@ -2113,6 +2596,17 @@ drink_app = DrinkReminderApp()
 async def index():
     drink_app.create_ui()
 
+def on_connect():
+    """Client connect handler - refresh displays skipped while no client was connected"""
+    drink_app._request_ui_update()
+
+def on_disconnect(client: Client):
+    """Client disconnect handler - forget its tab visibility and recalibration dialog"""
+    _HIDDEN_CLIENT_IDS.discard(client.id)
+    dialog = drink_app._recalibrate_dialogs.pop(client.id, None)
+    if dialog is not None:
+        dialog.submit(None)  # Release a _handle_very_empty still waiting for an answer
+
 # Startup and shutdown handlers
 async def on_startup():
     """App startup handler"""
@@ -2134,6 +2628,7 @@ async def on_shutdown():
         drink_app.event_manager.trigger_event('app_shutdown', {
             'shutdown_time': time_service.get_accurate_time().isoformat()
         })
+        drink_app._flush_pending_saves_sync()
         
         # Stop timer manager
         await drink_app.timer_manager.stop()
@@ -2142,6 +2637,8 @@ async def on_shutdown():
         print(f"Error during shutdown: {e}")
 
 app.on_startup(on_startup)
+app.on_connect(on_connect)
+app.on_disconnect(on_disconnect)
 app.on_shutdown(on_shutdown)
 
 if __name__ in {"__main__", "__mp_main__"}:
@@ -1,9 +1,18 @@
+import sys
+import asyncio
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
-from dataclasses import dataclass
+from typing import Deque, Dict, List, Tuple
+from dataclasses import dataclass, field
 from time_service import time_service
 from persistent_storage import storage, EventLogEntry
 
+# Number of events kept in memory for the UI event log
+RECENT_EVENTS_LIMIT = 10
+
+# Upper bound on the full in-memory event history (older events are still in the storage logs)
+EVENT_HISTORY_LIMIT = 2000
+
 @dataclass
 class Event:
     event_type: str
@@ -11,14 +20,23 @@ class Event:
     severity: int
     data: dict = None
     timer_name: str = None  # For timer-specific events
+    time_str: str = field(init=False, repr=False, compare=False)  # "%H:%M:%S" display string, fixed at creation
+    
+    def __post_init__(self):
+        self.time_str = self.timestamp.strftime("%H:%M:%S")
 
 class EventManager:
     def __init__(self):
-        self.events: List[Event] = []
+        self.events: Deque[Event] = deque(maxlen=EVENT_HISTORY_LIMIT)  # Oldest events drop off once full
+        self._recent_events: Deque[Event] = deque(maxlen=RECENT_EVENTS_LIMIT)  # Bounded tail of events for the UI log
+        self.last_event_by_type: Dict[str, Event] = {}  # Most recent event of each type
         
         # Load existing event counts from storage
         app_state = storage.load_app_state()
-        self.event_counts: Dict[str, int] = app_state.get('event_counts', {})
+        # Keys are interned so hot-path lookups with interned constants compare by identity
+        self.event_counts: Dict[str, int] = {sys.intern(key): count for key, count in app_state.get('event_counts', {}).items()}
+        self._save_handle = None  # Pending debounced event count save, if any
+        self._count_keys: Dict[Tuple[str, str], str] = {}  # (event_type, timer_name) -> interned count key
         
         # Load recent events from storage
         self._load_recent_events()
@@ -28,11 +46,7 @@ class EventManager:
         # Get accurate timestamp
         current_time = time_service.get_accurate_time()
         
-        # Create count key - use timer-specific key for timer events, global for others
-        if timer_name:
-            count_key = f"{timer_name}:{event_type}"
-        else:
-            count_key = event_type
+        count_key = self._count_key(event_type, timer_name)
         
         # Use custom severity if provided (for hydration-level based drink reminders)
         # Otherwise use count-based severity (for ignored reminder tracking)
@@ -55,6 +69,8 @@ class EventManager:
         )
         
         self.events.append(event)
+        self._recent_events.append(event)
+        self.last_event_by_type[event_type] = event
         
         # Log to persistent storage
         log_entry = EventLogEntry(
@@ -67,23 +83,43 @@ class EventManager:
         )
         storage.log_event(log_entry)
         
-        # Save updated event counts
-        self._save_event_counts()
+        # Save updated event counts (coalesced with other events in the next second)
+        self._request_save_event_counts()
         
         return event
     
+    def _count_key(self, event_type: str, timer_name: str = None) -> str:
+        """Get the count key - timer-specific for timer events, global for others (built once per pair)"""
+        count_key = self._count_keys.get((event_type, timer_name))
+        if count_key is None:
+            count_key = sys.intern(f"{timer_name}:{event_type}" if timer_name else event_type)
+            self._count_keys[(event_type, timer_name)] = count_key
+        return count_key
+    
+    def get_count(self, event_type: str, timer_name: str = None) -> int:
+        """Get how many times an event has been triggered (per timer for timer events)"""
+        return self.event_counts.get(self._count_key(event_type, timer_name), 0)
+    
+    def reset_count(self, event_type: str, timer_name: str = None):
+        """Reset an event count, e.g. when the issue behind ignored reminders is resolved"""
+        self.event_counts[self._count_key(event_type, timer_name)] = 0
+        self._request_save_event_counts()
+    
+    def recent_events(self) -> Deque[Event]:
+        """Get the most recent events (oldest first), without copying"""
+        return self._recent_events
+    
     def get_events_by_type(self, event_type: str) -> List[Event]:
         """Get all events of a specific type"""
         return [event for event in self.events if event.event_type == event_type]
     
     def get_latest_event(self, event_type: str) -> Event:
         """Get the most recent event of a specific type"""
-        events = self.get_events_by_type(event_type)
-        return events[-1] if events else None
+        return self.last_event_by_type.get(event_type)
     
     def get_recent_events(self, minutes: int = 60) -> List[Event]:
         """Get events from the last N minutes"""
-        cutoff = datetime.now().replace(second=0, microsecond=0)
+        cutoff = time_service.get_accurate_time().replace(second=0, microsecond=0)
         cutoff = cutoff - timedelta(minutes=minutes)
         
         return [event for event in self.events if event.timestamp >= cutoff]
@@ -91,6 +127,8 @@ class EventManager:
     def clear_events(self):
         """Clear all events (useful for testing)"""
         self.events.clear()
+        self._recent_events.clear()
+        self.last_event_by_type.clear()
         self.event_counts.clear()
         
         # Save cleared state
@@ -112,11 +150,32 @@ class EventManager:
                         timer_name=timer_name
                     )
                     self.events.append(event)
+                    self._recent_events.append(event)
+                    self.last_event_by_type[event.event_type] = event
                 except Exception as e:
                     print(f"Error loading event from log: {e}")
         except Exception as e:
             print(f"Error loading recent events: {e}")
     
+    def _request_save_event_counts(self, delay: float = 1.0):
+        """Schedule a coalesced save of event counts (at most one write per delay)"""
+        if self._save_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop running (startup or atexit) - save immediately
+            self._save_event_counts()
+            return
+        self._save_handle = loop.call_later(delay, self.flush)
+    
+    def flush(self):
+        """Write event counts now, cancelling any pending debounced save"""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        self._save_event_counts()
+    
     def _save_event_counts(self):
         """Save current event counts to storage"""
         try:
@@ -124,14 +183,3 @@ class EventManager:
             storage.save_app_state(current_time, self.event_counts, None)  # Don't update bottle_weight or daily consumption from EventManager
         except Exception as e:
             print(f"Error saving event counts: {e}")
-    
-    def cleanup_old_events(self, hours: int = 24):
-        """Remove old events from memory (keeps only recent ones)"""
-        if not self.events:
-            return
-        
-        cutoff_time = time_service.get_accurate_time().replace(hour=0, minute=0, second=0, microsecond=0)
-        cutoff_time = cutoff_time - timedelta(hours=hours)
-        
-        # Keep only recent events in memory
-        self.events = [event for event in self.events if event.timestamp >= cutoff_time] 
\ No newline at end of file
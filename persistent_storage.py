@@ -1,5 +1,7 @@
 import json
 import os
+import threading
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
@@ -24,10 +26,19 @@ class EventLogEntry:
     source: str = "app"
     timer_name: Optional[str] = None  # For timer-specific events
 
+def _synchronized(method):
+    """Serialize a read-modify-write storage method, as writes may come from a worker thread"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class PersistentStorage:
     def __init__(self, data_dir: str = "data"):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        self._lock = threading.RLock()  # Guards file read-modify-write cycles (see _synchronized)
         
         self.timer_state_file = self.data_dir / "timer_states.json"
         self.event_log_file = self.data_dir / "event_log.json"
@@ -77,10 +88,11 @@ class PersistentStorage:
             temp_file = file_path.with_suffix('.tmp')
             with open(temp_file, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
-            temp_file.rename(file_path)
+            os.replace(temp_file, file_path)
         except Exception as e:
             print(f"Error writing {file_path}: {e}")
     
+    @_synchronized
     def save_timer_states(self, timer_states: Dict[str, TimerState]):
         """Save timer states to file"""
         data = {name: asdict(state) for name, state in timer_states.items()}
@@ -97,6 +109,7 @@ class PersistentStorage:
                 print(f"Error loading timer state {name}: {e}")
         return states
     
+    @_synchronized
     def log_event(self, event: EventLogEntry):
         """Append event to log file"""
         try:
@@ -133,6 +146,7 @@ class PersistentStorage:
             print(f"Error getting recent events: {e}")
             return []
     
+    @_synchronized
     def save_app_state(self, app_start_time: datetime, event_counts: Dict[str, int], bottle_weight: int = None, daily_consumed_ml: float = None, last_daily_reset: str = None, config_overrides: Dict[str, Any] = None):
         """Save application state including bottle weight, daily consumption, and configuration overrides"""
         # Load existing data to preserve other fields
@@ -183,6 +197,7 @@ class PersistentStorage:
             
         self._write_json(self.app_state_file, data)
     
+    @_synchronized
     def save_daily_consumption(self, daily_consumed_ml: float, last_daily_reset: str):
         """Save just the daily consumption data to app state"""
         existing_data = self.load_app_state()
@@ -190,12 +205,14 @@ class PersistentStorage:
         existing_data["last_daily_reset"] = last_daily_reset
         self._write_json(self.app_state_file, existing_data)
     
+    @_synchronized
     def save_bottle_weight(self, bottle_weight: int):
         """Save just the bottle weight to app state"""
         existing_data = self.load_app_state()
         existing_data["bottle_weight"] = bottle_weight
         self._write_json(self.app_state_file, existing_data)
     
+    @_synchronized
     def update_lifetime_stats(self, ml_consumed: float = 0, drink_events: int = 0, new_session: bool = False, new_day: bool = False):
         """Update lifetime statistics"""
         existing_data = self.load_app_state()
@@ -240,6 +257,7 @@ class PersistentStorage:
             }
         })
     
+    @_synchronized
     def reset_session_data(self, preserve_lifetime_stats: bool = True):
         """Reset current session data while optionally preserving lifetime statistics
         
@@ -303,6 +321,7 @@ class PersistentStorage:
             print(f"❌ Error resetting session data: {e}")
             return False
     
+    @_synchronized
     def cleanup_old_logs(self, days: int = 30):
         """Remove log entries older than specified days"""
         try:
@@ -1,6 +1,7 @@
 import asyncio
 import aiohttp
 import json
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 import os
@@ -9,6 +10,7 @@ class TimeService:
     def __init__(self):
         self.api_time_offset = 0  # Offset between API time and system time
         self.last_sync_time = None
+        self._cached_time = None  # (whole second, offset, sync time, result) of the last get_accurate_time
         self.time_apis = [
             "http://worldclockapi.com/api/json/utc/now", 
             # "https://timeapi.io/api/Time/current/zone?timeZone=UTC"  # Commented out to reduce API calls
@@ -72,17 +74,28 @@ class TimeService:
         return None
     
     def get_accurate_time(self) -> datetime:
-        """Get the most accurate current time available"""
-        system_time = datetime.now(timezone.utc)
+        """Get the most accurate current time available.
+        
+        Results have whole-second resolution, so calls within the same second
+        (and with the same sync state) share one datetime.
+        """
+        now = time.time()
+        second = int(now)
+        cached = self._cached_time
+        if cached is not None and cached[0] == second and cached[1] == self.api_time_offset and cached[2] is self.last_sync_time:
+            return cached[3]
+        
+        accurate_time = datetime.fromtimestamp(second, timezone.utc)
         
         # If we have a recent sync, apply the offset
         if self.last_sync_time and self.api_time_offset:
-            time_since_sync = (system_time - self.last_sync_time).total_seconds()
+            time_since_sync = now - self.last_sync_time.timestamp()
             # Only use offset if sync was recent (within 1 hour)
             if time_since_sync < 3600:
-                return system_time.replace(microsecond=0) + timedelta(seconds=self.api_time_offset)
+                accurate_time += timedelta(seconds=self.api_time_offset)
         
-        return system_time.replace(microsecond=0)
+        self._cached_time = (second, self.api_time_offset, self.last_sync_time, accurate_time)
+        return accurate_time
     
     async def ensure_time_sync(self):
         """Ensure time is synced once at startup only"""
@@ -1,5 +1,6 @@
 import asyncio
 import random
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, Callable, Optional
 from dataclasses import dataclass
@@ -24,12 +25,20 @@ class TimerManager:
         self._running = False
         self._task = None
         self._save_task = None
+        self._persist_handle = None  # Pending debounced save, if any
+        self.changed = asyncio.Event()  # Set whenever timer state shown in the UI changes
+        self._batch_depth = 0  # Open batched_saves blocks
+        self._batch_saved_states = None  # Saved states read once per batch
     
     def add_timer(self, name: str, interval_minutes: int, callback: Callable, 
                   random_variance_minutes: int = 0):
         """Add a new timer"""
-        # Check if we have saved state for this timer
-        saved_states = storage.load_timer_states()
+        # Check if we have saved state for this timer (read once per batch)
+        saved_states = self._batch_saved_states
+        if saved_states is None:
+            saved_states = storage.load_timer_states()
+            if self._batch_depth:
+                self._batch_saved_states = saved_states
         saved_state = saved_states.get(name)
         
         current_time = time_service.get_accurate_time()
@@ -63,25 +72,44 @@ class TimerManager:
             timer.next_trigger_time = self._calculate_next_trigger(timer, current_time)
         
         self.timers[name] = timer
+        self.changed.set()
         print(f"Timer '{name}' added. Next trigger: {timer.next_trigger_time}")
         
-        # Save state immediately
-        self._save_timer_states()
+        # Save state immediately, or once when the enclosing batch ends
+        if not self._batch_depth:
+            self._save_timer_states()
+    
+    @contextmanager
+    def batched_saves(self):
+        """Add timers with a single read of saved states and a single save when the block exits"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._batch_saved_states = None
+                self._save_timer_states()
     
     def remove_timer(self, name: str):
         """Remove a timer"""
         if name in self.timers:
             del self.timers[name]
+            self.changed.set()
     
     def activate_timer(self, name: str):
         """Activate a timer"""
-        if name in self.timers:
-            self.timers[name].is_active = True
+        timer = self.timers.get(name)
+        if timer is not None and not timer.is_active:
+            timer.is_active = True
+            self.changed.set()
     
     def deactivate_timer(self, name: str):
         """Deactivate a timer"""
-        if name in self.timers:
-            self.timers[name].is_active = False
+        timer = self.timers.get(name)
+        if timer is not None and timer.is_active:
+            timer.is_active = False
+            self.changed.set()
     
     def reset_timer(self, name: str):
         """Reset a timer's last triggered time"""
@@ -89,7 +117,24 @@ class TimerManager:
             current_time = time_service.get_accurate_time()
             self.timers[name].last_triggered = None
             self.timers[name].next_trigger_time = self._calculate_next_trigger(self.timers[name], current_time)
-            self._save_timer_states()
+            self.changed.set()
+            self._request_persist()
+    
+    def update_interval(self, name: str, interval_minutes: int) -> bool:
+        """Change a timer's interval in place and re-arm its next trigger.
+        
+        Returns True if the interval changed.
+        """
+        timer = self.timers.get(name)
+        if timer is None or timer.interval_minutes == interval_minutes:
+            return False
+        
+        timer.interval_minutes = interval_minutes
+        # Recalculate next trigger time based on new interval
+        timer.next_trigger_time = self._calculate_next_trigger(timer, time_service.get_accurate_time())
+        self.changed.set()
+        self._request_persist()
+        return True
     
     def _calculate_next_trigger(self, timer: Timer, current_time: datetime) -> datetime:
         """Calculate when a timer should next trigger"""
@@ -136,11 +181,12 @@ class TimerManager:
                         
                         # Calculate next trigger time
                         timer.next_trigger_time = self._calculate_next_trigger(timer, current_time)
+                        self.changed.set()
                         
                         print(f"Timer '{timer.name}' triggered. Next trigger: {timer.next_trigger_time}")
                         
                         # Save state after triggering
-                        self._save_timer_states()
+                        self._request_persist()
                     except asyncio.TimeoutError:
                         print(f"Timer '{timer.name}' callback timed out (likely due to client disconnection)")
                         # Still update the timer state to prevent immediate re-triggering
@@ -148,7 +194,8 @@ class TimerManager:
                         timer.last_triggered = current_time
                         self.last_any_timer = current_time
                         timer.next_trigger_time = self._calculate_next_trigger(timer, current_time)
-                        self._save_timer_states()
+                        self.changed.set()
+                        self._request_persist()
                     except asyncio.CancelledError:
                         print(f"Timer '{timer.name}' callback was cancelled (client disconnected)")
                         # Still update the timer state to prevent immediate re-triggering
@@ -156,7 +203,8 @@ class TimerManager:
                         timer.last_triggered = current_time
                         self.last_any_timer = current_time
                         timer.next_trigger_time = self._calculate_next_trigger(timer, current_time)
-                        self._save_timer_states()
+                        self.changed.set()
+                        self._request_persist()
                     except Exception as e:
                         print(f"Error in timer {timer.name}: {e}")
                         # Don't update timer state on unexpected errors to allow retry
@@ -192,8 +240,8 @@ class TimerManager:
         print("Timer loop cancelled")
         self._running = False
         
-        # Save final state
-        self._save_timer_states()
+        # Save final state, including any pending debounced changes
+        self.flush()
         
         # Cancel and cleanup tasks properly
         tasks_to_cleanup = []
@@ -213,6 +261,25 @@ class TimerManager:
         self._task = None
         self._save_task = None
     
+    def _request_persist(self, delay: float = 1.0):
+        """Schedule a coalesced save of timer states (at most one write per delay)"""
+        if self._persist_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop yet (e.g. during startup) - save immediately
+            self._save_timer_states()
+            return
+        self._persist_handle = loop.call_later(delay, self.flush)
+    
+    def flush(self):
+        """Write timer states now, cancelling any pending debounced save"""
+        if self._persist_handle is not None:
+            self._persist_handle.cancel()
+            self._persist_handle = None
+        self._save_timer_states()
+    
     def _save_timer_states(self):
         """Save current timer states to storage"""
         try: